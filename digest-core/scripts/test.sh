@@ -15,9 +15,16 @@ if ! command -v pytest &> /dev/null; then
     exit 1
 fi
 
+# Spread tests across CPUs when pytest-xdist is installed (uv add --dev pytest-xdist)
+PARALLEL_ARGS=()
+if python -c "import xdist" &> /dev/null; then
+    echo "pytest-xdist found, running tests in parallel..."
+    PARALLEL_ARGS=(-n auto)
+fi
+
 # Run tests with coverage
 echo "Running tests with coverage..."
-pytest tests/ -v --cov=src/digest_core --cov-report=term-missing --cov-report=html
+pytest tests/ -v "${PARALLEL_ARGS[@]}" --cov=src/digest_core --cov-report=term-missing --cov-report=html
 
 # Check if tests passed
 if [ $? -eq 0 ]; then
@@ -150,6 +150,7 @@ class ChunkingConfig(BaseModel):
     adaptive_high_load_emails: int = Field(default=200, description="Email count threshold for high load")
     adaptive_high_load_threads: int = Field(default=60, description="Thread count threshold for high load")
     adaptive_multiplier: float = Field(default=0.75, description="Multiplier for high load")
+    split_workers: int = Field(default=1, ge=1, description="Worker processes for evidence splitting (1 = in-process)")
 
 
 class ShrinkConfig(BaseModel):
@@ -165,6 +166,7 @@ class EmailCleanerConfig(BaseModel):
     max_top_quote_paragraphs: int = Field(default=2, description="Max paragraphs to keep from top quote")
     max_top_quote_lines: int = Field(default=10, description="Max lines to keep from top quote")
     max_quote_removal_length: int = Field(default=10000, description="Max chars to remove in single quote block (safety limit)")
+    normalize_workers: int = Field(default=1, ge=1, description="Worker processes for body normalization (1 = in-process)")
     
     locales: List[str] = Field(default=["ru", "en"], description="Supported locales for pattern matching")
     
@@ -21,10 +21,10 @@ import re
 import math
 import structlog
 from typing import List, Dict, Optional, Tuple, Set
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from datetime import datetime
 
-from digest_core.evidence.lemmatizer import LightweightLemmatizer
+from digest_core.evidence.lemmatizer import get_lemmatizer
 
 logger = structlog.get_logger()
 
@@ -47,6 +47,9 @@ class ExtractedAction:
 class ActionMentionExtractor:
     """Extract actions and mentions from email text."""
     
+    # Max cached extraction results (bodies repeat across reply chains)
+    EXTRACT_CACHE_SIZE = 1024
+    
     # Russian imperative verbs and action markers
     RU_IMPERATIVE_VERBS = [
         r'\b(сделай(?:те)?|выполни(?:те)?|проверь(?:те)?|отправь(?:те)?|пришли(?:те)?)',
@@ -101,6 +104,14 @@ class ActionMentionExtractor:
         r'\b(can|could|would|will|should|is|are|do|does)\s+',
     ]
     
+    # Past tense / passive context: verbs here report, not request
+    PAST_TENSE_INDICATORS = [
+        r'\b(был|была|было|были)\b',  # RU: был/была/было/были
+        r'\b(was|were|has been|have been)\b',  # EN: was/were/has been/have been
+        r'\b\w+(ли|ла|ло)\s+(вчера|утром|сегодня|уже)\b',  # RU: прислали утром, сделали вчера
+        r'\b\w+ed\s+(yesterday|today|already)\b',  # EN: checked yesterday
+    ]
+    
     # Date/deadline patterns
     DATE_PATTERNS = [
         r'\b(до|к|не позднее)\s+\d{1,2}[./]\d{1,2}',  # до 15.01
@@ -129,12 +140,19 @@ class ActionMentionExtractor:
         self.user_aliases = [alias.lower() for alias in user_aliases]
         self.user_timezone = user_timezone
         
-        # Initialize lemmatizer with custom verbs
-        self.lemmatizer = LightweightLemmatizer(custom_verbs=custom_verbs)
+        # Shared lemmatizer for this custom verb set (built once per process)
+        self.lemmatizer = get_lemmatizer(tuple(sorted((custom_verbs or {}).items())))
         
         # Build action verb lemma sets for quick lookup
         self._build_action_verb_lemmas()
         
+        # Last (sentence, verb) lemma lookup: _find_imperative and
+        # _find_action_marker both fall back to it for the same sentence
+        self._last_lemma_lookup: Tuple[Optional[str], Optional[str]] = (None, None)
+        
+        # (text, sender_rank) -> extracted actions without msg_id, FIFO-bounded
+        self._extract_cache: Dict[Tuple[str, float], List[ExtractedAction]] = {}
+        
         # Compile regex patterns for performance
         self._compile_patterns()
     
@@ -159,6 +177,9 @@ class ActionMentionExtractor:
             'передать', 'исправить', 'поправить', 'обновить', 'изменить', 'завершить',
             'закончить', 'доделать', 'финализировать',
         }
+        
+        # Combined lookup for the lemma scan: most tokens miss, so probe once
+        self.action_verb_lemmas = frozenset(self.en_action_verbs | self.ru_action_verbs)
     
     def _compile_patterns(self):
         """Compile all regex patterns."""
@@ -169,6 +190,9 @@ class ActionMentionExtractor:
         self.ru_question_pattern = re.compile('|'.join(self.RU_QUESTION_MARKERS), re.IGNORECASE)
         self.en_question_pattern = re.compile('|'.join(self.EN_QUESTION_MARKERS), re.IGNORECASE)
         self.date_pattern = re.compile('|'.join(self.DATE_PATTERNS), re.IGNORECASE)
+        # Applied to lowercased text in the lemma fallback
+        self.past_tense_pattern = re.compile('|'.join(self.PAST_TENSE_INDICATORS))
+        self.word_pattern = re.compile(r'\b\w+\b')
     
     def extract_mentions_actions(
         self,
@@ -192,6 +216,27 @@ class ActionMentionExtractor:
         if not text:
             return []
         
+        # Reply chains repeat the same bodies: reuse the msg_id-free result
+        cache_key = (text, sender_rank)
+        templates = self._extract_cache.get(cache_key)
+        if templates is None:
+            templates = self._extract_templates(text, sender_rank)
+            if len(self._extract_cache) >= self.EXTRACT_CACHE_SIZE:
+                del self._extract_cache[next(iter(self._extract_cache))]
+            self._extract_cache[cache_key] = templates
+        
+        # Fresh copies: callers stamp evidence_id etc. on the returned actions
+        actions = [replace(template, msg_id=msg_id) for template in templates]
+        
+        logger.info("Extracted actions/mentions",
+                   msg_id=msg_id,
+                   total_actions=len(actions),
+                   avg_confidence=sum(a.confidence for a in actions) / len(actions) if actions else 0)
+        
+        return actions
+    
+    def _extract_templates(self, text: str, sender_rank: float) -> List[ExtractedAction]:
+        """Extract actions from text (uncached), without msg_id."""
         actions = []
         
         # Split into sentences
@@ -255,7 +300,6 @@ class ActionMentionExtractor:
                 text=sentence.strip(),
                 due=deadline,
                 confidence=confidence,
-                msg_id=msg_id,
                 start_offset=start_offset,
                 end_offset=end_offset
             )
@@ -265,11 +309,6 @@ class ActionMentionExtractor:
         # Sort by confidence (highest first)
         actions.sort(key=lambda a: a.confidence, reverse=True)
         
-        logger.info("Extracted actions/mentions",
-                   msg_id=msg_id,
-                   total_actions=len(actions),
-                   avg_confidence=sum(a.confidence for a in actions) / len(actions) if actions else 0)
-        
         return actions
     
     def _split_sentences(self, text: str) -> List[str]:
@@ -327,27 +366,31 @@ class ActionMentionExtractor:
         Returns:
             Found verb or None
         """
+        last_text, last_verb = self._last_lemma_lookup
+        if text == last_text:
+            return last_verb
+        
+        verb = self._scan_verb_by_lemma(text)
+        self._last_lemma_lookup = (text, verb)
+        return verb
+    
+    def _scan_verb_by_lemma(self, text: str) -> Optional[str]:
+        """Tokenize text once and return the first action verb lemma (uncached)."""
+        text_lower = text.lower()
+        
         # Skip if past tense passive context (not an action request)
-        past_tense_indicators = [
-            r'\b(был|была|было|были)\b',  # RU: был/была/было/были
-            r'\b(was|were|has been|have been)\b',  # EN: was/were/has been/have been
-            r'\b\w+(ли|ла|ло)\s+(вчера|утром|сегодня|уже)\b',  # RU: прислали утром, сделали вчера
-            r'\b\w+ed\s+(yesterday|today|already)\b',  # EN: checked yesterday
-        ]
-        for pattern in past_tense_indicators:
-            if re.search(pattern, text.lower()):
-                # Skip: past tense passive, not action
-                return None
+        if self.past_tense_pattern.search(text_lower):
+            return None
         
         # Tokenize (simple split)
-        tokens = re.findall(r'\b\w+\b', text.lower())
+        tokens = self.word_pattern.findall(text_lower)
         
         for token in tokens:
             # Lemmatize token
             lemma = self.lemmatizer.lemmatize_token(token, lang='auto')
             
             # Check if lemma is a known action verb
-            if lemma in self.en_action_verbs or lemma in self.ru_action_verbs:
+            if lemma in self.action_verb_lemmas:
                 logger.debug("Found action verb by lemma",
                             token=token,
                             lemma=lemma,
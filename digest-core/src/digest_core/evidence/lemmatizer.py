@@ -9,7 +9,9 @@ Approach:
 No heavy dependencies (spaCy, pymorphy2) - pure rule-based + lookup tables.
 """
 import re
-from typing import Dict, List, Set
+import functools
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Set, Tuple
 import structlog
 
 logger = structlog.get_logger()
@@ -18,6 +20,30 @@ logger = structlog.get_logger()
 class LightweightLemmatizer:
     """Lightweight lemmatization for RU/EN action verbs."""
     
+    # Max (token, lang) → lemma entries memoized per instance
+    LEMMA_CACHE_SIZE = 4096
+    
+    # RU imperative rules, tried in order: (suffix, min token length, endings)
+    RU_IMPERATIVE_RULES = (
+        ('йте', 3, ('ать', 'ить', 'еть')),  # сделайте → сделать
+        ('ите', 5, ('ить',)),               # проверите → проверить
+        ('и', 3, ('ить', 'еть', 'ать')),    # imperative singular
+    )
+    RU_IMPERATIVE_SUFFIXES = tuple(rule[0] for rule in RU_IMPERATIVE_RULES)
+    
+    # EN stemming rules, tried in order: (suffix, min token length, replacement)
+    EN_STEM_RULES = (
+        ('ing', 6, ''),   # checking → check
+        ('ed', 5, ''),    # checked → check
+        ('ied', 5, 'y'),  # studied → study
+        ('s', 4, ''),     # checks → check
+        ('es', 4, ''),    # fixes → fix
+    )
+    EN_STEM_SUFFIXES = tuple(rule[0] for rule in EN_STEM_RULES)
+    
+    # (en_table, ru_table, en_lemmas, ru_lemmas) without custom verbs
+    _base_tables = None
+    
     def __init__(self, custom_verbs: Dict[str, str] = None):
         """
         Initialize lemmatizer.
@@ -27,15 +53,43 @@ class LightweightLemmatizer:
         """
         self.custom_verbs = custom_verbs or {}
         
+        # Built-in tables are static: build once per process and share them
+        # between instances behind read-only proxies
+        if LightweightLemmatizer._base_tables is None:
+            LightweightLemmatizer._base_tables = self._build_base_tables()
+        en_table, ru_table, en_lemmas, ru_lemmas = LightweightLemmatizer._base_tables
+        
+        if self.custom_verbs:
+            # Merge custom verbs into per-instance copies
+            en_table = {**en_table, **self.custom_verbs}
+            ru_table = {**ru_table, **self.custom_verbs}
+            en_lemmas = frozenset(en_table.values())
+            ru_lemmas = frozenset(ru_table.values())
+        
         # EN: Common action verbs conjugation table
-        self.en_verb_table = self._build_en_verb_table()
+        self.en_verb_table = en_table
         
         # RU: Top-100 action verbs lemma table
-        self.ru_verb_table = self._build_ru_verb_table()
+        self.ru_verb_table = ru_table
+        
+        # Known lemmas per language for O(1) membership checks in the
+        # stemming/imperative fallbacks (instead of scanning table values)
+        self.en_lemmas = en_lemmas
+        self.ru_lemmas = ru_lemmas
         
-        # Merge custom verbs
-        self.en_verb_table.update(self.custom_verbs)
-        self.ru_verb_table.update(self.custom_verbs)
+        # Memoized lemmas: email text is Zipfian, a few verbs dominate
+        self._lemma_cache: Dict[Tuple[str, str], str] = {}
+        
+        # Per-token patterns, compiled once
+        self._cyrillic_re = re.compile(r'[а-яА-ЯёЁ]')
+        self._punct_re = re.compile(r'[^\w\s-]')
+    
+    def _build_base_tables(self) -> Tuple[Mapping[str, str], Mapping[str, str], frozenset, frozenset]:
+        """Build built-in EN/RU verb tables (read-only) and their lemma sets."""
+        en_table = self._build_en_verb_table()
+        ru_table = self._build_ru_verb_table()
+        return (MappingProxyType(en_table), MappingProxyType(ru_table),
+                frozenset(en_table.values()), frozenset(ru_table.values()))
     
     def _build_en_verb_table(self) -> Dict[str, str]:
         """
@@ -246,11 +300,24 @@ class LightweightLemmatizer:
         # Auto-detect language if needed
         if lang == 'auto':
             # Simple heuristic: Cyrillic = Russian
-            if re.search(r'[а-яА-ЯёЁ]', token):
+            if self._cyrillic_re.search(token):
                 lang = 'ru'
             else:
                 lang = 'en'
         
+        key = (token_lower, lang)
+        lemma = self._lemma_cache.get(key)
+        if lemma is None:
+            lemma = self._lemmatize(token_lower, lang)
+            if len(self._lemma_cache) >= self.LEMMA_CACHE_SIZE:
+                # Evict oldest entry (dicts preserve insertion order)
+                del self._lemma_cache[next(iter(self._lemma_cache))]
+            self._lemma_cache[key] = lemma
+        
+        return lemma
+    
+    def _lemmatize(self, token_lower: str, lang: str) -> str:
+        """Lemmatize a lowercased token for a resolved language (uncached)."""
         # Lookup in appropriate table
         if lang == 'ru':
             lemma = self.ru_verb_table.get(token_lower)
@@ -282,31 +349,18 @@ class LightweightLemmatizer:
         Common patterns:
         - -йте → base (сделайте → сделать)
         - -ите → base + ить (проверите → проверить)
+        - -и → base + ить/еть/ать
         """
-        # Rule 1: -йте ending (imperative plural)
-        if token.endswith('йте'):
-            # сделайте → сделать
-            base = token[:-3]
-            candidates = [base + 'ать', base + 'ить', base + 'еть']
-            for candidate in candidates:
-                if candidate in self.ru_verb_table.values():
-                    return candidate
-        
-        # Rule 2: -ите ending
-        if token.endswith('ите') and len(token) > 4:
-            # проверите → проверить
-            base = token[:-3]
-            candidate = base + 'ить'
-            if candidate in self.ru_verb_table.values():
-                return candidate
-        
-        # Rule 3: -и ending (imperative singular)
-        if token.endswith('и') and len(token) > 2:
-            base = token[:-1]
-            candidates = [base + 'ить', base + 'еть', base + 'ать']
-            for candidate in candidates:
-                if candidate in self.ru_verb_table.values():
-                    return candidate
+        if not token.endswith(self.RU_IMPERATIVE_SUFFIXES):
+            return None
+        
+        for suffix, min_len, endings in self.RU_IMPERATIVE_RULES:
+            if len(token) >= min_len and token.endswith(suffix):
+                base = token[:-len(suffix)]
+                for ending in endings:
+                    candidate = base + ending
+                    if candidate in self.ru_lemmas:
+                        return candidate
         
         return None
     
@@ -319,38 +373,16 @@ class LightweightLemmatizer:
         - -ed → base (checked → check)
         - -s → base (checks → check)
         """
-        # Rule 1: -ing
-        if token.endswith('ing') and len(token) > 5:
-            # checking → check
-            base = token[:-3]
-            # Handle doubling: running → run
-            if len(base) >= 2 and base[-1] == base[-2]:
-                base = base[:-1]
-            if base in self.en_verb_table.values():
-                return base
-        
-        # Rule 2: -ed
-        if token.endswith('ed') and len(token) > 4:
-            # checked → check
-            base = token[:-2]
-            if base in self.en_verb_table.values():
-                return base
-            # Handle -ied → -y: studied → study
-            if token.endswith('ied'):
-                base = token[:-3] + 'y'
-                if base in self.en_verb_table.values():
-                    return base
-        
-        # Rule 3: -s
-        if token.endswith('s') and len(token) > 3:
-            # checks → check
-            base = token[:-1]
-            if base in self.en_verb_table.values():
-                return base
-            # Handle -es: fixes → fix
-            if token.endswith('es'):
-                base = token[:-2]
-                if base in self.en_verb_table.values():
+        if not token.endswith(self.EN_STEM_SUFFIXES):
+            return None
+        
+        for suffix, min_len, replacement in self.EN_STEM_RULES:
+            if len(token) >= min_len and token.endswith(suffix):
+                base = token[:-len(suffix)] + replacement
+                # Handle doubling: running → run
+                if suffix == 'ing' and len(base) >= 2 and base[-1] == base[-2]:
+                    base = base[:-1]
+                if base in self.en_lemmas:
                     return base
         
         return None
@@ -372,7 +404,7 @@ class LightweightLemmatizer:
         lemmas = []
         for token in tokens:
             # Remove punctuation
-            clean_token = re.sub(r'[^\w\s-]', '', token)
+            clean_token = self._punct_re.sub('', token)
             if clean_token:
                 lemma = self.lemmatize_token(clean_token, lang)
                 lemmas.append(lemma)
@@ -403,3 +435,18 @@ class LightweightLemmatizer:
         
         return forms
 
+
+@functools.lru_cache(maxsize=8)
+def get_lemmatizer(custom_verbs_key: Tuple[Tuple[str, str], ...] = ()) -> LightweightLemmatizer:
+    """
+    Get a process-wide shared lemmatizer.
+    
+    Args:
+        custom_verbs_key: Custom verbs as sorted (form, lemma) pairs, e.g.
+                          tuple(sorted(custom_verbs.items()))
+    
+    Returns:
+        Shared LightweightLemmatizer instance. Callers must not mutate it;
+        construct a LightweightLemmatizer directly for a private copy.
+    """
+    return LightweightLemmatizer(custom_verbs=dict(custom_verbs_key))
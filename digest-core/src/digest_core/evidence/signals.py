@@ -14,6 +14,14 @@ except ImportError:
     regex = None
     _HAS_REGEX = False
 
+# Optional Aho-Corasick automaton for multi-verb search
+try:
+    import ahocorasick
+    _HAS_AHOCORASICK = True
+except ImportError:
+    ahocorasick = None
+    _HAS_AHOCORASICK = False
+
 # Safe Cyrillic word pattern with fallback
 def _get_cyrillic_word_pattern():
     """Get compiled Cyrillic word pattern with safe implementation."""
@@ -35,6 +43,47 @@ def _get_cyrillic_word_pattern():
 CYRILLIC_WORD = _get_cyrillic_word_pattern()
 
 
+# Russian date deadlines: "до/к/не позднее [число] [месяц]"
+_RU_DATE_PATTERN = (
+    r'\b(до|к|не позднее)\s+(\d{1,2})\s+(январ[ья]|феврал[ья]|марта|апрел[ья]|ма[яй]|'
+    r'июн[ья]|июл[ья]|август[а]?|сентябр[ья]|октябр[ья]|ноябр[ья]|декабр[ья])\b'
+)
+
+
+def _get_ru_date_pattern():
+    """Get compiled Russian date-deadline pattern (regex module if available)."""
+    if _HAS_REGEX:
+        # Use regex module for safer Unicode handling
+        return regex.compile(_RU_DATE_PATTERN, regex.IGNORECASE | regex.UNICODE)
+    
+    # Stdlib re fallback: explicit alternatives instead of range
+    return _stdre.compile(_RU_DATE_PATTERN, _stdre.IGNORECASE | _stdre.UNICODE)
+
+
+# Date patterns for extract_dates (initialized once, not per call)
+NUMERIC_DATE = _stdre.compile(r'\b\d{1,2}[./]\d{1,2}[./]\d{2,4}\b')  # DD/MM/YYYY, DD.MM.YYYY
+ISO_DATE = _stdre.compile(r'\b\d{4}-\d{2}-\d{2}\b')  # YYYY-MM-DD
+RU_DATE_DEADLINE = _get_ru_date_pattern()
+
+RELATIVE_DATES = [
+    'сегодня', 'завтра', 'вчера', 'послезавтра',
+    'today', 'tomorrow', 'yesterday',
+]
+
+
+def _set_backend(use_regex: bool) -> None:
+    """
+    Switch between the regex module and stdlib re, recompiling module patterns.
+    
+    Args:
+        use_regex: Prefer the regex module (ignored if it is not installed)
+    """
+    global _HAS_REGEX, CYRILLIC_WORD, RU_DATE_DEADLINE
+    _HAS_REGEX = use_regex and regex is not None
+    CYRILLIC_WORD = _get_cyrillic_word_pattern()
+    RU_DATE_DEADLINE = _get_ru_date_pattern()
+
+
 # Action verbs in Russian and English
 ACTION_VERBS_RU = [
     # Requests
@@ -67,6 +116,21 @@ ACTION_VERBS_EN = [
 ALL_ACTION_VERBS = ACTION_VERBS_RU + ACTION_VERBS_EN
 
 
+def _build_action_verb_automaton():
+    """Build Aho-Corasick automaton over ALL_ACTION_VERBS (None without pyahocorasick)."""
+    if not _HAS_AHOCORASICK:
+        return None
+    automaton = ahocorasick.Automaton()
+    for verb in ALL_ACTION_VERBS:
+        automaton.add_word(verb, verb)
+    automaton.make_automaton()
+    return automaton
+
+
+# Compiled automaton (initialized once)
+ACTION_VERB_AUTOMATON = _build_action_verb_automaton()
+
+
 def extract_action_verbs(text: str) -> List[str]:
     """
     Extract action verbs from text (both Russian and English).
@@ -81,14 +145,14 @@ def extract_action_verbs(text: str) -> List[str]:
         return []
     
     text_lower = text.lower()
-    found_verbs = []
     
-    for verb in ALL_ACTION_VERBS:
-        if verb in text_lower:
-            if verb not in found_verbs:
-                found_verbs.append(verb)
+    if ACTION_VERB_AUTOMATON is not None:
+        # Single pass, overlapping matches included (same as substring checks)
+        found = {verb for _, verb in ACTION_VERB_AUTOMATON.iter(text_lower)}
+        return [verb for verb in ALL_ACTION_VERBS if verb in found]
     
-    return found_verbs
+    # Fallback: substring check per verb (verbs are unique, no dedup needed)
+    return [verb for verb in ALL_ACTION_VERBS if verb in text_lower]
 
 
 def extract_dates(text: str) -> List[str]:
@@ -113,32 +177,13 @@ def extract_dates(text: str) -> List[str]:
     found_dates = []
     
     # Pattern 1: DD/MM/YYYY or DD.MM.YYYY
-    date_pattern_1 = r'\b\d{1,2}[./]\d{1,2}[./]\d{2,4}\b'
-    matches_1 = _stdre.findall(date_pattern_1, text)
-    found_dates.extend(matches_1)
+    found_dates.extend(NUMERIC_DATE.findall(text))
     
     # Pattern 2: YYYY-MM-DD
-    date_pattern_2 = r'\b\d{4}-\d{2}-\d{2}\b'
-    matches_2 = _stdre.findall(date_pattern_2, text)
-    found_dates.extend(matches_2)
+    found_dates.extend(ISO_DATE.findall(text))
     
     # Pattern 3: Russian date deadlines "до/к/не позднее [число] [месяц]"
-    # Safe implementation without hyphen-as-range in character classes
-    if _HAS_REGEX:
-        # Use regex module for safer Unicode handling
-        ru_date_pattern = regex.compile(
-            r'\b(до|к|не позднее)\s+(\d{1,2})\s+(январ[ья]|феврал[ья]|марта|апрел[ья]|ма[яй]|'
-            r'июн[ья]|июл[ья]|август[а]?|сентябр[ья]|октябр[ья]|ноябр[ья]|декабр[ья])\b',
-            regex.IGNORECASE | regex.UNICODE
-        )
-    else:
-        # Stdlib re fallback: explicit alternatives instead of range
-        ru_date_pattern = _stdre.compile(
-            r'\b(до|к|не позднее)\s+(\d{1,2})\s+(январ[ья]|феврал[ья]|марта|апрел[ья]|ма[яй]|'
-            r'июн[ья]|июл[ья]|август[а]?|сентябр[ья]|октябр[ья]|ноябр[ья]|декабр[ья])\b',
-            _stdre.IGNORECASE | _stdre.UNICODE
-        )
-    ru_date_matches = ru_date_pattern.findall(text)
+    ru_date_matches = RU_DATE_DEADLINE.findall(text)
     for match in ru_date_matches:
         # match is tuple: (prefix, day, month)
         date_str = f"{match[0]} {match[1]} {match[2]}"
@@ -146,12 +191,8 @@ def extract_dates(text: str) -> List[str]:
             found_dates.append(date_str)
     
     # Pattern 4: Relative dates
-    relative_dates_ru = ['сегодня', 'завтра', 'вчера', 'послезавтра']
-    relative_dates_en = ['today', 'tomorrow', 'yesterday']
-    all_relative = relative_dates_ru + relative_dates_en
-    
     text_lower = text.lower()
-    for rel_date in all_relative:
+    for rel_date in RELATIVE_DATES:
         if rel_date in text_lower:
             if rel_date not in found_dates:
                 found_dates.append(rel_date)
@@ -3,6 +3,8 @@ Evidence splitting for LLM processing.
 """
 import re as _stdre
 import uuid
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from typing import List, NamedTuple, Dict, Any
 import structlog
 
@@ -38,8 +40,28 @@ def _get_caps_cyrillic_pattern():
 
 CAPS_HEADER_PATTERN = _get_caps_cyrillic_pattern()
 
+# Other structural break lines, one alternation matched once per line:
+# markdown headers, numbered lists, email markers (On ... wrote:, От:, From:), horizontal rules
+STRUCTURAL_BREAK_PATTERN = _stdre.compile(
+    r'#{1,3}\s+'
+    r'|\s*\d+[\.)]\s+'
+    r'|(?:On .+ wrote:|От:|From:|Subject:)'
+    r'|[\-\*=]{3,}\s*$',
+    _stdre.IGNORECASE
+)
+
+
+def _set_backend(use_regex: bool) -> None:
+    """Switch CAPS_HEADER_PATTERN between the regex module and stdlib re."""
+    global _HAS_REGEX, CAPS_HEADER_PATTERN
+    _HAS_REGEX = use_regex and regex is not None
+    CAPS_HEADER_PATTERN = _get_caps_cyrillic_pattern()
+
 logger = structlog.get_logger()
 
+# Threads handed to a worker per round trip when splitting in parallel
+SPLIT_CHUNKSIZE = 8
+
 
 class EvidenceChunk(NamedTuple):
     """A chunk of evidence for LLM processing."""
@@ -77,16 +99,20 @@ class EvidenceSplitter:
                    total_emails=total_emails,
                    total_threads=total_threads)
         
-        all_chunks = []
-        
-        for thread in threads:
-            try:
-                chunks = self._split_thread_evidence(thread, total_emails, total_threads)
-                all_chunks.extend(chunks)
-            except Exception as e:
-                logger.warning("Failed to split thread evidence", 
-                             conversation_id=thread.conversation_id, error=str(e))
-                continue
+        # Threads split independently: fan out to worker processes if configured
+        workers = min(self.chunking_config.split_workers, len(threads))
+        if workers > 1:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                per_thread = pool.map(
+                    self._split_thread_safe, threads,
+                    repeat(total_emails), repeat(total_threads),
+                    chunksize=SPLIT_CHUNKSIZE,
+                )
+                all_chunks = [chunk for chunks in per_thread for chunk in chunks]
+        else:
+            all_chunks = []
+            for thread in threads:
+                all_chunks.extend(self._split_thread_safe(thread, total_emails, total_threads))
         
         # Sort chunks by priority score
         all_chunks.sort(key=lambda c: c.priority_score, reverse=True)
@@ -100,6 +126,16 @@ class EvidenceSplitter:
         
         return limited_chunks
     
+    def _split_thread_safe(self, thread: ConversationThread,
+                           total_emails: int = 0, total_threads: int = 0) -> List[EvidenceChunk]:
+        """Split a single thread, logging and skipping it on failure."""
+        try:
+            return self._split_thread_evidence(thread, total_emails, total_threads)
+        except Exception as e:
+            logger.warning("Failed to split thread evidence", 
+                         conversation_id=thread.conversation_id, error=str(e))
+            return []
+    
     def _split_thread_evidence(self, thread: ConversationThread, 
                                total_emails: int = 0, total_threads: int = 0) -> List[EvidenceChunk]:
         """Split a single thread into evidence chunks."""
@@ -118,27 +154,14 @@ class EvidenceSplitter:
         Detect structural break points in text (headers, lists, separators).
         Returns list of line indices where breaks occur.
         """
-        lines = text.split('\n')
-        break_points = []
-        
-        for i, line in enumerate(lines):
-            # Markdown headers
-            if _stdre.match(r'^#{1,3}\s+', line):
-                break_points.append(i)
-            # CAPS + colon (ЗАГОЛОВОК: / HEADER:) - use safe pattern
-            elif CAPS_HEADER_PATTERN.match(line):
-                break_points.append(i)
-            # Numbered lists
-            elif _stdre.match(r'^\s*\d+[\.)]\s+', line):
-                break_points.append(i)
-            # Email markers (On ... wrote:, От:, From:)
-            elif _stdre.match(r'^(On .+ wrote:|От:|From:|Subject:)', line, _stdre.IGNORECASE):
-                break_points.append(i)
-            # Horizontal rules
-            elif _stdre.match(r'^[\-\*=]{3,}\s*$', line):
-                break_points.append(i)
-        
-        return break_points
+        # CAPS + colon (ЗАГОЛОВОК: / HEADER:) stays separate: it may use the regex module
+        break_match = STRUCTURAL_BREAK_PATTERN.match
+        caps_match = CAPS_HEADER_PATTERN.match
+        
+        return [
+            i for i, line in enumerate(text.split('\n'))
+            if break_match(line) or caps_match(line)
+        ]
     
     def _split_message_content(self, message, conversation_id: str, message_index: int,
                                total_emails: int = 0, total_threads: int = 0) -> List[EvidenceChunk]:
@@ -150,8 +173,13 @@ class EvidenceSplitter:
         if not content:
             return chunks
         
+        # Split by paragraphs first
+        paragraphs = [p for p in (p.strip() for p in content.split('\n\n')) if p]
+        # Word counts per paragraph, computed once (words never span paragraphs)
+        paragraph_words = [len(p.split()) for p in paragraphs]
+        
         # Calculate adaptive max_chunks_per_message
-        message_tokens = int(len(content.split()) * 1.3)
+        message_tokens = int(sum(paragraph_words) * 1.3)
         
         if message_tokens > self.chunking_config.long_email_tokens:
             base_max = self.chunking_config.max_chunks_if_long
@@ -165,21 +193,16 @@ class EvidenceSplitter:
         
         max_chunks_for_message = base_max
         
-        # Detect structural breaks for better segmentation
-        structural_breaks = self._detect_structural_breaks(content)
-        
-        # Split by paragraphs first (but respect structural breaks)
-        paragraphs = [p.strip() for p in content.split('\n\n') if p.strip()]
-        
         current_chunk = ""
+        current_words = 0  # running word count of current_chunk
         chunk_count = 0
         
-        for paragraph in paragraphs:
+        for paragraph, words in zip(paragraphs, paragraph_words):
             # Estimate tokens (rough approximation: 1.3 tokens per word)
-            paragraph_tokens = int(len(paragraph.split()) * 1.3)
+            paragraph_tokens = int(words * 1.3)
             
             # If adding this paragraph would exceed max tokens, finalize current chunk
-            current_chunk_tokens = int(len(current_chunk.split()) * 1.3)
+            current_chunk_tokens = int(current_words * 1.3)
             if current_chunk_tokens + paragraph_tokens > self.max_tokens_per_chunk:
                 if current_chunk and current_chunk_tokens >= self.min_tokens_per_chunk:
                     chunk = self._create_evidence_chunk(
@@ -188,6 +211,7 @@ class EvidenceSplitter:
                     chunks.append(chunk)
                     chunk_count += 1
                     current_chunk = ""
+                    current_words = 0
                 
                 # If single paragraph is too long, split by sentences
                 if paragraph_tokens > self.max_tokens_per_chunk:
@@ -196,19 +220,21 @@ class EvidenceSplitter:
                     chunk_count += len(sentence_chunks)
                 else:
                     current_chunk = paragraph
+                    current_words = words
             else:
                 # Add paragraph to current chunk
                 if current_chunk:
                     current_chunk += "\n\n" + paragraph
                 else:
                     current_chunk = paragraph
+                current_words += words
             
             # Limit chunks per message (adaptive)
             if chunk_count >= max_chunks_for_message:
                 break
         
         # Add final chunk if it exists
-        final_chunk_tokens = int(len(current_chunk.split()) * 1.3)
+        final_chunk_tokens = int(current_words * 1.3)
         if current_chunk and final_chunk_tokens >= self.min_tokens_per_chunk:
             chunk = self._create_evidence_chunk(
                 current_chunk, conversation_id, message, message_index, chunk_count
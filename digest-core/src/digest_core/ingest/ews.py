@@ -1,10 +1,11 @@
 """
 Exchange Web Services (EWS) email ingestion with NTLM authentication.
 """
+import sys
 import structlog
 from datetime import datetime, timezone, timedelta
 from typing import List, NamedTuple, Optional
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 import pytz
 from exchangelib import (
@@ -21,9 +22,13 @@ from digest_core.utils.tz import ensure_aware, to_utc
 logger = structlog.get_logger()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class NormalizedMessage:
-    """Normalized email message with canonical email metadata fields."""
+    """
+    Normalized email message with canonical email metadata fields.
+    
+    Slotted: a digest holds thousands of these, so no per-instance __dict__.
+    """
     msg_id: str
     conversation_id: str
     datetime_received: datetime
@@ -37,7 +42,9 @@ class NormalizedMessage:
     has_attachments: bool
     attachment_types: List[str]  # ["pdf", "xlsx", ...]
     
-    # Canonical email metadata fields for forward/backward compatibility
+    # Canonical email metadata fields for forward/backward compatibility.
+    # Ingest and normalization pass the same objects as the legacy fields
+    # above, so each pair costs one slot pointer, not a second copy.
     from_email: str
     from_name: Optional[str]
     to_emails: List[str]
@@ -46,10 +53,12 @@ class NormalizedMessage:
     body_norm: str
     received_at: datetime
     
-    @property
-    def sender(self) -> str:
-        """Backward compatibility alias for sender_email."""
-        return self.from_email or self.sender_email or ""
+    # Backward compatibility alias for sender_email; resolved once since it
+    # is read on every alias match and grouping pass
+    sender: str = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        object.__setattr__(self, "sender", self.from_email or self.sender_email or "")
 
 
 class EWSIngest:
@@ -356,17 +365,20 @@ class EWSIngest:
                 conversation_id = ""
         else:
             conversation_id = ""
+        # A digest has few distinct threads and correspondents: intern their
+        # IDs/addresses so repeated values share one string object
+        conversation_id = sys.intern(conversation_id)
         
         # Get sender email address
         sender_email = ""
         if msg.sender and hasattr(msg.sender, 'email_address') and msg.sender.email_address:
-            sender_email = msg.sender.email_address.lower()
+            sender_email = sys.intern(msg.sender.email_address.lower())
         
         # Get recipients
         to_recipients = []
         if hasattr(msg, 'to_recipients') and msg.to_recipients:
             to_recipients = [
-                r.email_address.lower() 
+                sys.intern(r.email_address.lower())
                 for r in msg.to_recipients 
                 if hasattr(r, 'email_address') and r.email_address
             ]
@@ -374,7 +386,7 @@ class EWSIngest:
         cc_recipients = []
         if hasattr(msg, 'cc_recipients') and msg.cc_recipients:
             cc_recipients = [
-                r.email_address.lower() 
+                sys.intern(r.email_address.lower())
                 for r in msg.cc_recipients 
                 if hasattr(r, 'email_address') and r.email_address
             ]
@@ -4,10 +4,11 @@ Timezone normalization utilities.
 Ensures all datetime objects are timezone-aware.
 """
 from datetime import datetime
-from zoneinfo import ZoneInfo
 from typing import Optional
 import structlog
 
+from digest_core.utils.tz import get_zone
+
 logger = structlog.get_logger()
 
 
@@ -37,7 +38,7 @@ def ensure_tz_aware(
     if dt is None:
         return None
     
-    mailbox_zone = ZoneInfo(mailbox_tz)
+    mailbox_zone = get_zone(mailbox_tz)
     
     if dt.tzinfo is None:
         # Naive datetime
@@ -99,5 +100,5 @@ def get_current_tz_aware(tz_name: str) -> datetime:
     Returns:
         Current datetime in specified timezone
     """
-    return datetime.now(ZoneInfo(tz_name))
+    return datetime.now(get_zone(tz_name))
 
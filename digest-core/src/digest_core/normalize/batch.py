@@ -0,0 +1,86 @@
+"""
+Batch message normalization across worker processes.
+
+HTML parsing and quote cleaning are CPU-bound and independent per message,
+so large digests can fan the work out to a process pool
+(email_cleaner.normalize_workers). Each worker builds its own
+HTMLNormalizer/QuoteCleaner once (lazily) and reuses it for every body.
+"""
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Tuple
+import structlog
+
+from digest_core.normalize.html import HTMLNormalizer
+from digest_core.normalize.quotes import QuoteCleaner, RemovedSpan
+
+logger = structlog.get_logger()
+
+# Bodies handed to a worker per round trip
+BATCH_CHUNKSIZE = 16
+
+# Per-process normalizers (set up by _init_worker or on first use)
+_normalizer: Optional[HTMLNormalizer] = None
+_quote_cleaner: Optional[QuoteCleaner] = None
+
+
+def _init_worker(cleaner_config=None):
+    """Create this process's normalizer and quote cleaner."""
+    global _normalizer, _quote_cleaner
+    _normalizer = HTMLNormalizer()
+    keep_top_quote_head = cleaner_config.keep_top_quote_head if cleaner_config else True
+    _quote_cleaner = QuoteCleaner(keep_top_quote_head=keep_top_quote_head, config=cleaner_config)
+
+
+def normalize_one(html_body: str) -> Tuple[str, List[RemovedSpan]]:
+    """
+    Normalize a single message body: HTML → text, truncate, clean quotes.
+
+    Args:
+        html_body: Raw message body (HTML or plain text)
+
+    Returns:
+        Tuple of (cleaned_body, removed_spans)
+    """
+    if _normalizer is None:
+        _init_worker()
+
+    text_body, _ = _normalizer.html_to_text(html_body)
+
+    # Truncate large bodies (200KB limit)
+    text_body = _normalizer.truncate_text(text_body, max_bytes=200000)
+
+    return _quote_cleaner.clean_email_body(text_body, lang="auto", policy="standard")
+
+
+def normalize_batch(
+    htmls: List[str],
+    cleaner_config=None,
+    workers: int = 1,
+) -> List[Tuple[str, List[RemovedSpan]]]:
+    """
+    Normalize many message bodies, in parallel when worthwhile.
+
+    Small batches (or a single worker) run in-process: pool startup costs
+    more than it saves below a couple of chunks.
+
+    Args:
+        htmls: Raw message bodies
+        cleaner_config: EmailCleanerConfig for the quote cleaners (optional)
+        workers: Process count (1 = in-process)
+
+    Returns:
+        List of (cleaned_body, removed_spans), in input order
+    """
+    workers = min(workers, -(-len(htmls) // BATCH_CHUNKSIZE))
+
+    if workers <= 1:
+        _init_worker(cleaner_config)
+        return [normalize_one(html_body) for html_body in htmls]
+
+    logger.info("Normalizing messages in parallel", messages=len(htmls), workers=workers)
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(cleaner_config,),
+    ) as pool:
+        return list(pool.map(normalize_one, htmls, chunksize=BATCH_CHUNKSIZE))
@@ -311,11 +311,16 @@ class HTMLNormalizer:
     
     def truncate_text(self, text: str, max_bytes: int = 200000) -> str:
         """Truncate text if it exceeds size limit."""
-        if len(text.encode('utf-8')) <= max_bytes:
+        # UTF-8 uses at most 4 bytes per character: short texts fit without encoding
+        if len(text) * 4 <= max_bytes:
             return text
         
-        # Truncate to fit within byte limit
-        truncated = text.encode('utf-8')[:max_bytes].decode('utf-8', errors='ignore')
+        data = text.encode('utf-8')
+        if len(data) <= max_bytes:
+            return text
+        
+        # Truncate to fit within byte limit (drops a split trailing character)
+        truncated = data[:max_bytes].decode('utf-8', errors='ignore')
         
         # Add truncation marker
         truncated += "\n[TRUNCATED]"
@@ -120,6 +120,24 @@ class QuoteCleaner:
         self.signature_regex = re.compile('|'.join(self.signature_patterns), re.MULTILINE | re.IGNORECASE)
         self.disclaimer_regex = re.compile('|'.join(self.disclaimer_patterns), re.MULTILINE | re.IGNORECASE)
         self.autoresponse_regex = re.compile('|'.join(self.autoresponse_patterns), re.MULTILINE | re.IGNORECASE)
+        
+        # Line-level patterns for the quote state machine (one alternation per check)
+        self.explicit_quote_marker_regex = re.compile(
+            r'-----Original Message-----|----- Переадресованное сообщение -----', re.IGNORECASE)
+        # Header lines between an Outlook-style quote header and the > body
+        self.quote_header_meta_regex = re.compile(
+            r'^(?:От|Дата|From|Date|Sent|To|Subject|Кому|Тема):', re.IGNORECASE)
+        # Metadata lines inside an already skipped quote
+        self.quoted_meta_regex = re.compile(
+            r'^(?:From|To|Subject|Date|Sent|Received|От|Дата|Тема|Кому|Cc):', re.IGNORECASE)
+        # Leading header lines skipped by extract_main_content
+        self.main_header_regex = re.compile(
+            r'^(?:Subject|To|From|Date|Sent|Received):', re.IGNORECASE)
+        self.leading_email_regex = re.compile(r'^[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}')
+        
+        # Whitespace cleanup
+        self.blank_lines_regex = re.compile(r'\n\s*\n\s*\n+')
+        self.multi_space_regex = re.compile(r' +')
     
     def clean_email_body(self, text: str, lang: str = "auto", policy: str = "standard") -> Tuple[str, List[RemovedSpan]]:
         """
@@ -226,10 +244,8 @@ class QuoteCleaner:
             is_quote_marker = False
             if quote_prefix_count == 0:  # Not a > quoted line
                 # Check for explicit markers
-                for pattern in [r'-----Original Message-----', r'----- Переадресованное сообщение -----']:
-                    if re.search(pattern, line, re.IGNORECASE):
-                        is_quote_marker = True
-                        break
+                if self.explicit_quote_marker_regex.search(line):
+                    is_quote_marker = True
                 
                 # Check for quote headers (On ... wrote:, От:, From:) only if not in a quote yet
                 if not is_quote_marker and quote_state is None:
@@ -266,7 +282,7 @@ class QuoteCleaner:
                 # In MS Outlook style, we've seen От:/Дата: and waiting for > content
                 # Skip any metadata lines (От:, Дата:, etc.)
                 if quote_prefix_count == 0:
-                    if any(re.match(p, line.strip(), re.IGNORECASE) for p in [r'^От:', r'^Дата:', r'^From:', r'^Date:', r'^Sent:', r'^To:', r'^Subject:', r'^Кому:', r'^Тема:']):
+                    if self.quote_header_meta_regex.match(line.strip()):
                         # Still in metadata, skip
                         i += 1
                         continue
@@ -383,7 +399,7 @@ class QuoteCleaner:
                 # In deep_quote, we skip everything - this handles -----Original Message----- case
                 if quote_prefix_count == 0 and not is_quote_marker:
                     # Check if this line is quoted content metadata (From:, To:, Subject:, etc.)
-                    if any(re.match(p, line.strip(), re.IGNORECASE) for p in [r'^From:', r'^To:', r'^Subject:', r'^Date:', r'^Sent:', r'^Received:', r'^От:', r'^Дата:', r'^Тема:', r'^Кому:', r'^Cc:']):
+                    if self.quoted_meta_regex.match(line.strip()):
                         # Still in quoted metadata
                         i += 1
                         continue
@@ -487,10 +503,10 @@ class QuoteCleaner:
     def _clean_whitespace(self, text: str) -> str:
         """Clean up excessive whitespace."""
         # Replace multiple newlines with single newline
-        text = re.sub(r'\n\s*\n\s*\n+', '\n\n', text)
+        text = self.blank_lines_regex.sub('\n\n', text)
         
         # Replace multiple spaces with single space
-        text = re.sub(r' +', ' ', text)
+        text = self.multi_space_regex.sub(' ', text)
         
         # Remove leading/trailing whitespace from each line
         lines = [line.strip() for line in text.split('\n')]
@@ -514,19 +530,10 @@ class QuoteCleaner:
         content_start = 0
         
         # Skip common email headers/patterns
-        skip_patterns = [
-            r'^Subject:',
-            r'^To:',
-            r'^From:',
-            r'^Date:',
-            r'^Sent:',
-            r'^Received:',
-        ]
-        
         for i, line in enumerate(lines):
-            if any(re.match(pattern, line, re.IGNORECASE) for pattern in skip_patterns):
+            if self.main_header_regex.match(line):
                 content_start = i + 1
-            elif line.strip() and not re.match(r'^[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}', line):
+            elif line.strip() and not self.leading_email_regex.match(line):
                 # Found non-header content
                 content_start = i
                 break
@@ -25,7 +25,7 @@ class HealthCheckHandler(BaseHTTPRequestHandler):
         elif self.path == '/readyz':
             self.send_readiness_response()
         else:
-            self.send_error(404, "Not Found")
+            self.send_not_found_response()
     
     def send_health_response(self):
         """Send health check response."""
@@ -40,6 +40,13 @@ class HealthCheckHandler(BaseHTTPRequestHandler):
         self.end_headers()
         self.wfile.write(json.dumps(response).encode('utf-8'))
     
+    def send_not_found_response(self):
+        """Send JSON 404 for unknown paths."""
+        self.send_response(404)
+        self.send_header('Content-Type', 'application/json')
+        self.end_headers()
+        self.wfile.write(json.dumps({"error": "Not Found"}).encode('utf-8'))
+    
     def send_readiness_response(self):
         """Send readiness check response."""
         # Readiness check: is the service ready to accept requests?
@@ -14,8 +14,7 @@ DEFAULT_PROMPT_VERSION = "mvp.5"
 
 from digest_core.config import Config
 from digest_core.ingest.ews import EWSIngest, NormalizedMessage
-from digest_core.normalize.html import HTMLNormalizer
-from digest_core.normalize.quotes import QuoteCleaner
+from digest_core.normalize.batch import normalize_batch
 from digest_core.threads.build import ThreadBuilder
 from digest_core.evidence.split import EvidenceSplitter
 from digest_core.select.context import ContextSelector
@@ -135,36 +134,26 @@ def run_digest(from_date: str, sources: List[str], out: str, model: str, window:
         
         # Step 2: Normalize messages
         logger.info("Starting message normalization", stage="normalize")
-        normalizer = HTMLNormalizer()
-        quote_cleaner = QuoteCleaner(
-            keep_top_quote_head=config.email_cleaner.keep_top_quote_head,
-            config=config.email_cleaner
-        )
-        
         normalized_messages = []
         total_removed_chars = 0
         total_removed_blocks = 0
         
-        for msg in messages:
-            # HTML to text conversion
-            text_body, html_removed_spans = normalizer.html_to_text(msg.text_body)
-            
-            # Truncate large bodies (200KB limit)
-            text_body = normalizer.truncate_text(text_body, max_bytes=200000)
-            
-            # Clean quotes and signatures with span tracking (new extractive pipeline)
-            if config.email_cleaner.enabled:
-                cleaned_body, removed_spans = quote_cleaner.clean_email_body(text_body, lang="auto", policy="standard")
-                
-                # Record metrics
-                for span in removed_spans:
-                    span_chars = span.end - span.start
-                    total_removed_chars += span_chars
-                    total_removed_blocks += 1
-                    metrics.record_cleaner_removed_chars(span_chars, span.type)
-                    metrics.record_cleaner_removed_blocks(1, span.type)
-            else:
-                cleaned_body = text_body
+        # HTML to text, truncation (200KB) and quote/signature cleaning with
+        # span tracking, fanned out across processes for large batches
+        normalized_bodies = normalize_batch(
+            [msg.text_body for msg in messages],
+            cleaner_config=config.email_cleaner,
+            workers=config.email_cleaner.normalize_workers
+        )
+        
+        for msg, (cleaned_body, removed_spans) in zip(messages, normalized_bodies):
+            # Record metrics
+            for span in removed_spans:
+                span_chars = span.end - span.start
+                total_removed_chars += span_chars
+                total_removed_blocks += 1
+                metrics.record_cleaner_removed_chars(span_chars, span.type)
+                metrics.record_cleaner_removed_blocks(1, span.type)
             
             # Create normalized message
             normalized_msg = NormalizedMessage(
@@ -925,36 +914,26 @@ def run_digest_dry_run(from_date: str, sources: List[str], out: str, model: str,
         
         # Step 2: Normalize messages
         logger.info("Starting message normalization", stage="normalize")
-        normalizer = HTMLNormalizer()
-        quote_cleaner = QuoteCleaner(
-            keep_top_quote_head=config.email_cleaner.keep_top_quote_head,
-            config=config.email_cleaner
-        )
-        
         normalized_messages = []
         total_removed_chars = 0
         total_removed_blocks = 0
         
-        for msg in messages:
-            # HTML to text conversion
-            text_body, html_removed_spans = normalizer.html_to_text(msg.text_body)
-            
-            # Truncate large bodies (200KB limit)
-            text_body = normalizer.truncate_text(text_body, max_bytes=200000)
-            
-            # Clean quotes and signatures with span tracking (new extractive pipeline)
-            if config.email_cleaner.enabled:
-                cleaned_body, removed_spans = quote_cleaner.clean_email_body(text_body, lang="auto", policy="standard")
-                
-                # Record metrics
-                for span in removed_spans:
-                    span_chars = span.end - span.start
-                    total_removed_chars += span_chars
-                    total_removed_blocks += 1
-                    metrics.record_cleaner_removed_chars(span_chars, span.type)
-                    metrics.record_cleaner_removed_blocks(1, span.type)
-            else:
-                cleaned_body = text_body
+        # HTML to text, truncation (200KB) and quote/signature cleaning with
+        # span tracking, fanned out across processes for large batches
+        normalized_bodies = normalize_batch(
+            [msg.text_body for msg in messages],
+            cleaner_config=config.email_cleaner,
+            workers=config.email_cleaner.normalize_workers
+        )
+        
+        for msg, (cleaned_body, removed_spans) in zip(messages, normalized_bodies):
+            # Record metrics
+            for span in removed_spans:
+                span_chars = span.end - span.start
+                total_removed_chars += span_chars
+                total_removed_blocks += 1
+                metrics.record_cleaner_removed_chars(span_chars, span.type)
+                metrics.record_cleaner_removed_blocks(1, span.type)
             
             # Create normalized message
             normalized_msg = NormalizedMessage(
@@ -2,7 +2,8 @@
 Context selection for relevant evidence chunks using balanced bucket strategy.
 """
 import re
-from typing import List, Dict
+import functools
+from typing import List, Dict, Optional
 from datetime import datetime, timezone
 from collections import defaultdict
 import structlog
@@ -18,6 +19,17 @@ except ImportError:
 logger = structlog.get_logger()
 
 
+@functools.lru_cache(maxsize=4096)
+def _parse_received_at(received_at: str) -> datetime:
+    """Parse an ISO 8601 received_at into UTC (cached: chunks of one message share it)."""
+    if dateutil:
+        msg_time = dateutil.parser.isoparse(received_at)
+    else:
+        # Fallback to standard datetime parsing
+        msg_time = datetime.fromisoformat(received_at.replace('Z', '+00:00'))
+    return msg_time.astimezone(timezone.utc)
+
+
 class SelectionMetrics:
     """Metrics for evidence selection process."""
     
@@ -121,12 +133,13 @@ class ContextSelector:
     def _calculate_enhanced_scores(self, chunks: List[EvidenceChunk]) -> List[EvidenceChunk]:
         """Calculate enhanced scores for all chunks using configured weights."""
         scored_chunks = []
+        now = datetime.now(timezone.utc)  # one reference time for the whole batch
         
         for chunk in chunks:
             score = 0.0
             
             # 1. Recency (затухание по времени)
-            recency_score = self._calculate_recency_score(chunk)
+            recency_score = self._calculate_recency_score(chunk, now)
             score += recency_score * self.weights_config.recency
             
             # 2. AddressedToMe
@@ -176,7 +189,7 @@ class ContextSelector:
         
         return scored_chunks
     
-    def _calculate_recency_score(self, chunk: EvidenceChunk) -> float:
+    def _calculate_recency_score(self, chunk: EvidenceChunk, now: Optional[datetime] = None) -> float:
         """
         Calculate recency score with exponential decay.
         
@@ -192,15 +205,12 @@ class ContextSelector:
         
         try:
             # Parse ISO datetime
-            if dateutil:
-                msg_time = dateutil.parser.isoparse(received_at)
-            else:
-                # Fallback to standard datetime parsing
-                msg_time = datetime.fromisoformat(received_at.replace('Z', '+00:00'))
+            msg_time = _parse_received_at(received_at)
             
             # Calculate hours ago
-            now = datetime.now(timezone.utc)
-            hours_ago = (now - msg_time.astimezone(timezone.utc)).total_seconds() / 3600
+            if now is None:
+                now = datetime.now(timezone.utc)
+            hours_ago = (now - msg_time).total_seconds() / 3600
             
             if hours_ago < 1:
                 return 1.0
@@ -232,11 +242,14 @@ class ContextSelector:
         return False
     
     def _get_dedup_key(self, chunk: EvidenceChunk) -> tuple:
-        """Get deduplication key (msg_id, start, end) for chunk."""
-        msg_id = chunk.source_ref.get('msg_id', '')
-        start = chunk.source_ref.get('start', 0)
-        end = chunk.source_ref.get('end', 0)
-        return (msg_id, start, end)
+        """
+        Get deduplication key (msg_id, start, end) for chunk.
+
+        EvidenceChunk is an immutable NamedTuple, so the key cannot be memoized
+        on the chunk itself; _select_with_buckets computes it once per chunk.
+        """
+        get = chunk.source_ref.get
+        return (get('msg_id', ''), get('start', 0), get('end', 0))
     
     def _select_with_buckets(self, scored_chunks: List[EvidenceChunk]) -> List[EvidenceChunk]:
         """
@@ -253,16 +266,32 @@ class ContextSelector:
         thread_chunk_counts = defaultdict(int)
         remaining_budget = 3000  # Token budget
         
-        # Sort all chunks by score (highest first)
+        # Sort all chunks by score (highest first) once; every bucket below walks
+        # this order, so per-bucket candidate lists need no re-sorting.
         all_sorted = sorted(scored_chunks, key=lambda c: c.priority_score, reverse=True)
         
+        # Column views over all_sorted, built in a single pass so the bucket loops
+        # don't repeat attribute/dict lookups per chunk.
+        dedup_keys = []
+        addressed_idx = []
+        date_idx = []
+        critical_idx = []
+        for i, chunk in enumerate(all_sorted):
+            dedup_keys.append(self._get_dedup_key(chunk))
+            if chunk.addressed_to_me:
+                addressed_idx.append(i)
+            if len(chunk.signals.get('dates', [])) > 0:
+                date_idx.append(i)
+            if chunk.signals.get('sender_rank', 1) >= 2:
+                critical_idx.append(i)
+        
         # Bucket 1: threads_top - cover different threads (1 chunk each by default)
         threads_covered = set()
         bucket_name = 'threads_top'
         bucket_kept = 0
         bucket_dropped = 0
         
-        for chunk in all_sorted:
+        for chunk, dedup_key in zip(all_sorted, dedup_keys):
             if len(threads_covered) >= self.buckets_config.threads_top:
                 bucket_dropped += 1
                 continue
@@ -273,7 +302,6 @@ class ContextSelector:
                 continue
             
             # Deduplication by (msg_id, start, end)
-            dedup_key = self._get_dedup_key(chunk)
             if dedup_key in seen_chunks:
                 bucket_dropped += 1
                 continue
@@ -298,12 +326,10 @@ class ContextSelector:
         bucket_dropped = 0
         min_required = 1  # Ensure at least 1 if available
         
-        addressed_chunks = [c for c in all_sorted if c.addressed_to_me]
-        addressed_chunks = sorted(addressed_chunks, key=lambda c: c.priority_score, reverse=True)
-        
-        for chunk in addressed_chunks:
+        for i in addressed_idx:
+            chunk = all_sorted[i]
             # Skip if already selected
-            dedup_key = self._get_dedup_key(chunk)
+            dedup_key = dedup_keys[i]
             if dedup_key in seen_chunks:
                 bucket_dropped += 1
                 continue
@@ -339,12 +365,10 @@ class ContextSelector:
         bucket_dropped = 0
         min_required = 1  # Ensure at least 1 if available
         
-        date_chunks = [c for c in all_sorted if len(c.signals.get('dates', [])) > 0]
-        date_chunks = sorted(date_chunks, key=lambda c: c.priority_score, reverse=True)
-        
-        for chunk in date_chunks:
+        for i in date_idx:
+            chunk = all_sorted[i]
             # Skip if already selected
-            dedup_key = self._get_dedup_key(chunk)
+            dedup_key = dedup_keys[i]
             if dedup_key in seen_chunks:
                 bucket_dropped += 1
                 continue
@@ -379,12 +403,10 @@ class ContextSelector:
         bucket_kept = 0
         bucket_dropped = 0
         
-        critical_chunks = [c for c in all_sorted if c.signals.get('sender_rank', 1) >= 2]
-        critical_chunks = sorted(critical_chunks, key=lambda c: c.priority_score, reverse=True)
-        
-        for chunk in critical_chunks:
+        for i in critical_idx:
+            chunk = all_sorted[i]
             # Skip if already selected
-            dedup_key = self._get_dedup_key(chunk)
+            dedup_key = dedup_keys[i]
             if dedup_key in seen_chunks:
                 bucket_dropped += 1
                 continue
@@ -416,12 +438,8 @@ class ContextSelector:
         bucket_kept = 0
         bucket_dropped = 0
         
-        remainder_chunks = [c for c in all_sorted]
-        remainder_chunks = sorted(remainder_chunks, key=lambda c: c.priority_score, reverse=True)
-        
-        for chunk in remainder_chunks:
+        for chunk, dedup_key in zip(all_sorted, dedup_keys):
             # Skip if already selected
-            dedup_key = self._get_dedup_key(chunk)
             if dedup_key in seen_chunks:
                 bucket_dropped += 1
                 continue
@@ -449,8 +467,9 @@ class ContextSelector:
         logger.info(f"Bucket {bucket_name}: kept={bucket_kept}, dropped={bucket_dropped}")
         
         # Track discarded action-like chunks
+        selected_ids = {id(c) for c in selected}
         for chunk in scored_chunks:
-            if chunk not in selected:
+            if id(chunk) not in selected_ids:
                 action_verbs = chunk.signals.get('action_verbs', [])
                 dates = chunk.signals.get('dates', [])
                 if len(action_verbs) > 0 or len(dates) > 0 or chunk.addressed_to_me:
@@ -539,13 +558,15 @@ class ContextSelector:
                     
                     # Remove lowest scored over-quota chunks
                     to_remove.sort(key=lambda c: c.priority_score)
+                    removed_ids = set()
                     for chunk in to_remove:
                         if current_tokens > max_tokens:
-                            kept.remove(chunk)
+                            removed_ids.add(id(chunk))
                             current_tokens -= chunk.token_count
                             self.metrics.shrinks_count += 1
                         else:
                             break
+                    kept = [c for c in kept if id(c) not in removed_ids]
         
         # Step 4: Global low-score removal (preserve min quotas)
         if current_tokens > max_tokens:
@@ -611,7 +632,7 @@ class ContextSelector:
         chunks_sorted = sorted(chunks, key=lambda c: c.priority_score)
         
         current_tokens = sum(c.token_count for c in chunks)
-        kept = list(chunks)
+        removed_ids = set()  # filtered out in one pass (list.remove is O(n) per call)
         
         for chunk in chunks_sorted:
             if current_tokens <= max_tokens:
@@ -623,14 +644,14 @@ class ContextSelector:
             if bucket in ['threads_top', 'addressed_to_me', 'dates_deadlines', 'critical_senders']:
                 min_quota = getattr(self.buckets_config, bucket)
                 if bucket_counts[bucket] > min_quota:
-                    kept.remove(chunk)
+                    removed_ids.add(id(chunk))
                     current_tokens -= chunk.token_count
                     bucket_counts[bucket] -= 1
                     self.metrics.shrinks_count += 1
             else:
                 # Remainder bucket, can remove freely
-                kept.remove(chunk)
+                removed_ids.add(id(chunk))
                 current_tokens -= chunk.token_count
                 self.metrics.shrinks_count += 1
         
-        return kept
+        return [c for c in chunks if id(c) not in removed_ids]
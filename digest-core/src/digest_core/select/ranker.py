@@ -14,15 +14,28 @@ Features:
 No external ML dependencies - pure rule-based scoring.
 """
 import re
+import functools
 import structlog
-from typing import List, Dict, Any, Optional
+from collections import Counter
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime, timezone
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 
 logger = structlog.get_logger()
 
 
-@dataclass
+@functools.lru_cache(maxsize=4096)
+def _parse_timestamp(timestamp: str) -> datetime:
+    """Parse an ISO 8601 chunk timestamp (cached: chunks are ranked once per digest section)."""
+    return datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
+
+
+def _now() -> datetime:
+    """Current UTC time (single clock source, patchable in tests)."""
+    return datetime.now(timezone.utc)
+
+
+@dataclass(slots=True)
 class RankingFeatures:
     """Features extracted for ranking."""
     user_in_to: bool = False
@@ -67,6 +80,14 @@ class DigestRanker:
         r'\[#\d+\]',
     ]
     
+    # Action markers (matched as substrings of lowercased text)
+    ACTION_MARKERS = [
+        # English
+        'please', 'need to', 'must', 'should', 'can you', 'could you', 'review', 'approve',
+        # Russian
+        'пожалуйста', 'нужно', 'необходимо', 'прошу', 'сделайте', 'проверьте',
+    ]
+    
     def __init__(
         self,
         weights: Optional[Dict[str, float]] = None,
@@ -83,11 +104,29 @@ class DigestRanker:
         """
         self.weights = weights or self.DEFAULT_WEIGHTS.copy()
         self.user_aliases = [alias.lower() for alias in (user_aliases or [])]
+        
+        # One alternation over aliases: recipients may be "Name <alias>", so match substrings
+        self.user_alias_pattern = (
+            re.compile('|'.join(map(re.escape, self.user_aliases))) if self.user_aliases else None
+        )
         self.important_senders = [s.lower() for s in (important_senders or [])]
         
+        # Precomputed sender lookups: exact emails, "@domain" entries, domain keywords
+        self._important_exact = set(self.important_senders)
+        self._important_domains = {
+            s.split('@')[1] for s in self.important_senders if '@' in s
+        }
+        keywords = [s for s in self.important_senders if '@' not in s]
+        self._important_keyword_pattern = (
+            re.compile('|'.join(map(re.escape, keywords))) if keywords else None
+        )
+        
         # Compile project tag patterns
         self.project_tag_pattern = re.compile('|'.join(self.PROJECT_TAG_PATTERNS))
         
+        # One alternation instead of a substring scan per marker
+        self.action_marker_pattern = re.compile('|'.join(map(re.escape, self.ACTION_MARKERS)))
+        
         # Validate weights
         self._validate_weights()
     
@@ -117,9 +156,12 @@ class DigestRanker:
         """
         logger.info("Starting item ranking", item_count=len(items))
         
+        # Index chunks once instead of rescanning them for every item
+        chunk_index = self._index_chunks(evidence_chunks)
+        
         # Extract features and calculate scores
         for item in items:
-            features = self._extract_features(item, evidence_chunks)
+            features = self._extract_features(item, evidence_chunks, chunk_index)
             score = self._calculate_score(features)
             
             # Store score in item (if possible)
@@ -129,7 +171,7 @@ class DigestRanker:
             logger.debug("Item ranked",
                         evidence_id=getattr(item, 'evidence_id', 'unknown'),
                         score=score,
-                        features=features.__dict__)
+                        features=asdict(features))
         
         # Sort by score (highest first)
         sorted_items = sorted(
@@ -144,13 +186,38 @@ class DigestRanker:
         
         return sorted_items
     
-    def _extract_features(self, item: Any, evidence_chunks: List[Any]) -> RankingFeatures:
+    def _index_chunks(self, evidence_chunks: List[Any]) -> Tuple[Dict[str, Any], Counter, datetime]:
+        """
+        Index evidence chunks for feature extraction.
+        
+        Args:
+            evidence_chunks: All evidence chunks
+        
+        Returns:
+            Tuple of (first chunk per evidence_id, chunk count per thread_id,
+            reference time for recency)
+        """
+        chunks_by_id = {}
+        for chunk in evidence_chunks:
+            chunks_by_id.setdefault(chunk.evidence_id, chunk)
+        
+        thread_counts = Counter(getattr(c, 'thread_id', None) for c in evidence_chunks)
+        
+        return chunks_by_id, thread_counts, _now()
+    
+    def _extract_features(
+        self,
+        item: Any,
+        evidence_chunks: List[Any],
+        chunk_index: Optional[Tuple[Dict[str, Any], Counter, datetime]] = None
+    ) -> RankingFeatures:
         """
         Extract ranking features from item.
         
         Args:
             item: Digest item
             evidence_chunks: All evidence chunks
+            chunk_index: Prebuilt _index_chunks(evidence_chunks) (optional)
         
         Returns:
             RankingFeatures
@@ -162,28 +229,20 @@ class DigestRanker:
         if not evidence_id:
             return features
         
-        matching_chunks = [c for c in evidence_chunks if c.evidence_id == evidence_id]
-        if not matching_chunks:
-            return features
+        if chunk_index is None:
+            chunk_index = self._index_chunks(evidence_chunks)
+        chunks_by_id, thread_counts, now = chunk_index
         
-        chunk = matching_chunks[0]
+        chunk = chunks_by_id.get(evidence_id)
+        if chunk is None:
+            return features
         
         # Feature 1: user_in_to / user_in_cc
         if hasattr(chunk, 'message_metadata'):
             metadata = chunk.message_metadata
-            to_recipients = metadata.get('to_recipients', [])
-            cc_recipients = metadata.get('cc_recipients', [])
-            
-            for alias in self.user_aliases:
-                if any(alias in str(r).lower() for r in to_recipients):
-                    features.user_in_to = True
-                    break
-            
+            features.user_in_to = self._has_user_alias(metadata.get('to_recipients', []))
             if not features.user_in_to:
-                for alias in self.user_aliases:
-                    if any(alias in str(r).lower() for r in cc_recipients):
-                        features.user_in_cc = True
-                        break
+                features.user_in_cc = self._has_user_alias(metadata.get('cc_recipients', []))
         
         # Feature 2: action/mention (check if item is ExtractedActionItem or has action markers)
         item_type = type(item).__name__
@@ -213,14 +272,12 @@ class DigestRanker:
         # Feature 5: thread length
         if hasattr(chunk, 'thread_id'):
             # Count chunks in same thread
-            thread_chunks = [c for c in evidence_chunks if getattr(c, 'thread_id', None) == chunk.thread_id]
-            features.thread_length = len(thread_chunks)
+            features.thread_length = thread_counts[chunk.thread_id]
         
         # Feature 6: recency
         if hasattr(chunk, 'timestamp'):
             try:
-                timestamp = datetime.fromisoformat(chunk.timestamp.replace('Z', '+00:00'))
-                now = datetime.now(timezone.utc)
+                timestamp = _parse_timestamp(chunk.timestamp)
                 hours_diff = (now - timestamp).total_seconds() / 3600
                 features.hours_since_received = hours_diff
             except Exception as e:
@@ -239,23 +296,19 @@ class DigestRanker:
         
         return features
     
+    def _has_user_alias(self, recipients: List[Any]) -> bool:
+        """Check if any recipient contains one of the user's aliases."""
+        if self.user_alias_pattern is None:
+            return False
+        search = self.user_alias_pattern.search
+        return any(search(str(r).lower()) for r in recipients)
+    
     def _has_action_markers(self, text: str) -> bool:
         """Check if text contains action markers."""
         if not text:
             return False
         
-        text_lower = text.lower()
-        
-        # English action markers
-        en_markers = ['please', 'need to', 'must', 'should', 'can you', 'could you', 'review', 'approve']
-        # Russian action markers
-        ru_markers = ['пожалуйста', 'нужно', 'необходимо', 'прошу', 'сделайте', 'проверьте']
-        
-        for marker in en_markers + ru_markers:
-            if marker in text_lower:
-                return True
-        
-        return False
+        return self.action_marker_pattern.search(text.lower()) is not None
     
     def _calculate_sender_importance(self, sender: str) -> float:
         """
@@ -270,19 +323,17 @@ class DigestRanker:
         sender_lower = sender.lower()
         
         # Check exact match
-        if sender_lower in self.important_senders:
+        if sender_lower in self._important_exact:
             return 1.0
         
         # Check domain match
         if '@' in sender_lower:
             domain = sender_lower.split('@')[1]
-            for important in self.important_senders:
-                if '@' in important:
-                    important_domain = important.split('@')[1]
-                    if domain == important_domain:
-                        return 0.8
-                elif important in domain:  # Domain keyword match
-                    return 0.7
+            if domain in self._important_domains:
+                return 0.8
+            # Domain keyword match
+            if self._important_keyword_pattern and self._important_keyword_pattern.search(domain):
+                return 0.7
         
         # Default: medium importance
         return 0.5
@@ -14,7 +14,7 @@ import hashlib
 import structlog
 
 from digest_core.ingest.ews import NormalizedMessage
-from digest_core.threads.subject_normalizer import SubjectNormalizer, calculate_text_similarity
+from digest_core.threads.subject_normalizer import SubjectNormalizer, get_text_ngrams, ngram_similarity
 
 logger = structlog.get_logger()
 
@@ -35,6 +35,9 @@ class ConversationThread(NamedTuple):
 class ThreadBuilder:
     """Build conversation threads from normalized messages."""
     
+    # Bodies shorter than this ("ok", "+1", "Thanks!") are never deduplicated
+    MIN_DEDUP_BODY_CHARS = 16
+    
     def __init__(self, semantic_similarity_threshold: float = 0.7):
         """
         Initialize ThreadBuilder.
@@ -115,30 +118,32 @@ class ThreadBuilder:
             Tuple of (unique_messages, duplicate_map)
             duplicate_map: {primary_msg_id: [duplicate_msg_ids]}
         """
-        checksum_index = {}  # checksum -> primary msg_id
+        # body -> primary msg_id. The index lives for one batch only, so the
+        # body string itself is the key (str hash is cached, equality is exact);
+        # SHA-256 is computed just for the duplicate log line.
+        body_index = {}
         duplicate_map = defaultdict(list)
         unique_messages = []
         seen_msg_ids = set()
         
         for msg in messages:
-            # Calculate checksum of body
             body_text = msg.text_body or ""
-            checksum = hashlib.sha256(body_text.encode('utf-8')).hexdigest()
             
-            # Check if we've seen this exact body before
-            if checksum in checksum_index:
-                primary_msg_id = checksum_index[checksum]
+            # Check if we've seen this exact body before (short replies like
+            # "ok"/"+1" repeat naturally and are not treated as duplicates)
+            if len(body_text) >= self.MIN_DEDUP_BODY_CHARS and body_text in body_index:
+                primary_msg_id = body_index[body_text]
                 duplicate_map[primary_msg_id].append(msg.msg_id)
                 self.stats['duplicates_found'] += 1
                 logger.debug("Duplicate message found",
                            primary_msg_id=primary_msg_id,
                            duplicate_msg_id=msg.msg_id,
-                           checksum=checksum[:16])
+                           checksum=hashlib.sha256(body_text.encode('utf-8')).hexdigest()[:16])
                 continue
             
             # First time seeing this body
             if msg.msg_id not in seen_msg_ids:
-                checksum_index[checksum] = msg.msg_id
+                body_index[body_text] = msg.msg_id
                 seen_msg_ids.add(msg.msg_id)
                 unique_messages.append(msg)
         
@@ -176,9 +181,13 @@ class ThreadBuilder:
         """
         thread_groups = defaultdict(list)
         thread_id_map = {}  # msg_id -> assigned_thread_id
+        # normalized subject -> earliest-created subj_ thread holding such a message
+        subject_index = {}
+        thread_rank = {}  # thread_id -> creation order (thread_groups order)
         
         for msg in messages:
             assigned_thread_id = None
+            normalized_subject = None
             
             # Strategy 1: Use EWS conversation_id if available
             if msg.conversation_id:
@@ -204,26 +213,12 @@ class ThreadBuilder:
                 self.stats['subjects_normalized'] += 1
                 
                 if normalized_subject:
-                    # Check if we have existing thread with this subject
-                    subject_thread_id = f"subj_{hash(normalized_subject)}"
-                    
-                    # Look for existing thread with same normalized subject
-                    found_existing = False
-                    for existing_thread_id, existing_messages in thread_groups.items():
-                        if existing_thread_id.startswith("subj_"):
-                            # Check if any message in this thread has same normalized subject
-                            for existing_msg in existing_messages:
-                                existing_norm, _ = self.subject_normalizer.normalize(existing_msg.subject)
-                                if existing_norm == normalized_subject:
-                                    assigned_thread_id = existing_thread_id
-                                    found_existing = True
-                                    self.stats['threads_merged_by_subject'] += 1
-                                    break
-                        if found_existing:
-                            break
-                    
-                    if not assigned_thread_id:
-                        assigned_thread_id = subject_thread_id
+                    # Join existing thread with same normalized subject (O(1) lookup)
+                    assigned_thread_id = subject_index.get(normalized_subject)
+                    if assigned_thread_id:
+                        self.stats['threads_merged_by_subject'] += 1
+                    else:
+                        assigned_thread_id = f"subj_{hash(normalized_subject)}"
                 else:
                     # No subject, create single-message thread
                     assigned_thread_id = f"single_{msg.msg_id}"
@@ -231,6 +226,17 @@ class ThreadBuilder:
             # Add message to thread
             thread_groups[assigned_thread_id].append(msg)
             thread_id_map[msg.msg_id] = assigned_thread_id
+            thread_rank.setdefault(assigned_thread_id, len(thread_rank))
+            
+            # Index subj_ threads by every normalized subject they contain
+            # (replies joined via Strategy 2 may carry a different subject)
+            if assigned_thread_id.startswith("subj_"):
+                if normalized_subject is None:
+                    normalized_subject, _ = self.subject_normalizer.normalize(msg.subject)
+                if normalized_subject:
+                    current = subject_index.get(normalized_subject)
+                    if current is None or thread_rank[assigned_thread_id] < thread_rank[current]:
+                        subject_index[normalized_subject] = assigned_thread_id
         
         logger.info("Messages grouped into threads",
                    thread_count=len(thread_groups),
@@ -285,25 +291,28 @@ class ThreadBuilder:
             
             # Multiple threads with same normalized subject
             # Check if they should be merged based on content similarity
-            clusters = []  # List of [thread_ids, messages]
+            clusters = []  # List of (thread_ids, messages, first-body n-grams)
             
             for thread_id, messages in thread_list:
                 if not messages:
                     continue
                 
-                # Get first message body for comparison
-                first_body = messages[0].text_body or ""
+                # First message body n-grams, built once per thread
+                first_ngrams = get_text_ngrams(messages[0].text_body or "", max_chars=200)
                 
                 # Try to find similar cluster
                 merged = False
-                for cluster_threads, cluster_messages in clusters:
-                    cluster_first_body = cluster_messages[0].text_body or ""
+                size = len(first_ngrams)
+                for cluster_threads, cluster_messages, cluster_ngrams in clusters:
+                    # Jaccard <= min(|A|, |B|) / max(|A|, |B|): skip pairs that can't reach threshold
+                    cluster_size = len(cluster_ngrams)
+                    if size and cluster_size and (
+                        min(size, cluster_size) / max(size, cluster_size)
+                        < self.semantic_similarity_threshold
+                    ):
+                        continue
                     
-                    similarity = calculate_text_similarity(
-                        first_body,
-                        cluster_first_body,
-                        max_chars=200
-                    )
+                    similarity = ngram_similarity(first_ngrams, cluster_ngrams)
                     
                     if similarity >= self.semantic_similarity_threshold:
                         # Merge into this cluster
@@ -318,10 +327,10 @@ class ThreadBuilder:
                 
                 if not merged:
                     # Create new cluster
-                    clusters.append(([thread_id], messages))
+                    clusters.append(([thread_id], messages, first_ngrams))
             
             # Add clusters to merged groups
-            for cluster_threads, cluster_messages in clusters:
+            for cluster_threads, cluster_messages, _ in clusters:
                 # Use first thread_id as primary
                 primary_thread_id = cluster_threads[0]
                 merged_groups[primary_thread_id] = cluster_messages
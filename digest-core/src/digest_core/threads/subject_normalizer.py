@@ -10,6 +10,7 @@ Removes:
 
 Preserves original for display.
 """
+import functools
 import re
 import unicodedata
 import structlog
@@ -57,16 +58,43 @@ class SubjectNormalizer:
         r'\([^)]{1,50}\)',   # (tag), (project), etc.
     ]
     
+    # Max nested reply/forward prefixes stripped from one subject
+    MAX_PREFIX_RUN = 10
+    
+    # Smart quotes (‘ ’ “ ” « ») → straight quotes
+    QUOTES_TABLE = str.maketrans({
+        '\u2018': "'", '\u2019': "'",
+        '\u201c': '"', '\u201d': '"',
+        '«': '"', '»': '"',
+    })
+    
+    # Em dash (—) and en dash (–) → hyphen
+    DASHES_TABLE = str.maketrans({'—': '-', '–': '-'})
+    
+    PUNCTUATION_TABLE = {**QUOTES_TABLE, **DASHES_TABLE}
+    
+    # Distinct subjects memoized per normalizer (RE:/FW: copies of one subject repeat a lot)
+    NORMALIZE_CACHE_SIZE = 8192
+    
     def __init__(self):
         """Initialize SubjectNormalizer."""
         # Compile regex patterns for performance
         self._compile_patterns()
+        
+        # Per-instance cache: results depend on this instance's compiled patterns
+        self._normalize_cached = functools.lru_cache(maxsize=self.NORMALIZE_CACHE_SIZE)(
+            self._normalize_uncached
+        )
     
     def _compile_patterns(self):
         """Compile all regex patterns."""
-        # Combine all prefixes
-        all_prefixes = self.RU_PREFIXES + self.EN_PREFIXES
-        self.prefix_pattern = re.compile('|'.join(all_prefixes), re.IGNORECASE)
+        # Combine all prefixes into one anchored run: RE: RE: FW: is stripped in a
+        # single pass (at most MAX_PREFIX_RUN nested prefixes, as before)
+        all_prefixes = [p.lstrip('^') for p in self.RU_PREFIXES + self.EN_PREFIXES]
+        self.prefix_pattern = re.compile(
+            '^(?:' + '|'.join(all_prefixes) + '){1,%d}' % self.MAX_PREFIX_RUN,
+            re.IGNORECASE
+        )
         
         # External markers
         self.external_pattern = re.compile('|'.join(self.EXTERNAL_MARKERS), re.IGNORECASE)
@@ -100,20 +128,19 @@ class SubjectNormalizer:
         Returns:
             Tuple of (normalized_subject, original_subject)
         """
+        return self._normalize_cached(subject)
+    
+    def _normalize_uncached(self, subject: str) -> Tuple[str, str]:
+        """Run the normalization pipeline (see normalize)."""
         if not subject:
             return "", ""
         
         original = subject.strip()
         normalized = original
         
-        # Step 1: Remove prefixes (iteratively, as they may be nested)
+        # Step 1: Remove prefixes (nested ones in one pass)
         # RE: RE: FW: Subject → Subject
-        max_iterations = 10  # Prevent infinite loop
-        for _ in range(max_iterations):
-            before = normalized
-            normalized = self.prefix_pattern.sub('', normalized).strip()
-            if normalized == before:
-                break  # No more prefixes found
+        normalized = self.prefix_pattern.sub('', normalized, count=1).strip()
         
         # Step 2: Remove external markers
         normalized = self.external_pattern.sub('', normalized).strip()
@@ -124,11 +151,9 @@ class SubjectNormalizer:
         # Step 4: Remove emoji
         normalized = self.emoji_pattern.sub('', normalized).strip()
         
-        # Step 5: Normalize quotes (smart quotes → straight quotes)
-        normalized = self._normalize_quotes(normalized)
-        
-        # Step 6: Normalize dashes (em/en dash → hyphen)
-        normalized = self._normalize_dashes(normalized)
+        # Steps 5-6: Normalize quotes and dashes in one translate pass
+        # (smart quotes → straight quotes, em/en dash → hyphen)
+        normalized = normalized.translate(self.PUNCTUATION_TABLE)
         
         # Step 7: Normalize whitespace (multiple spaces → single space)
         normalized = ' '.join(normalized.split())
@@ -149,20 +174,11 @@ class SubjectNormalizer:
     
     def _normalize_quotes(self, text: str) -> str:
         """Normalize smart quotes to straight quotes."""
-        # Smart single quotes
-        text = text.replace("'", "'").replace("'", "'")
-        # Smart double quotes
-        text = text.replace(""", '"').replace(""", '"')
-        text = text.replace("«", '"').replace("»", '"')
-        return text
+        return text.translate(self.QUOTES_TABLE)
     
     def _normalize_dashes(self, text: str) -> str:
         """Normalize em/en dashes to hyphen."""
-        # Em dash (—)
-        text = text.replace("—", "-")
-        # En dash (–)
-        text = text.replace("–", "-")
-        return text
+        return text.translate(self.DASHES_TABLE)
     
     def is_similar(self, subject1: str, subject2: str) -> bool:
         """
@@ -185,46 +201,54 @@ class SubjectNormalizer:
         return norm1 == norm2
 
 
-def calculate_text_similarity(text1: str, text2: str, max_chars: int = 200) -> float:
+def get_text_ngrams(text: str, max_chars: int = 200, n: int = 3) -> frozenset:
     """
-    Calculate cosine similarity between first N characters of two texts.
-    
-    Uses character n-grams for simplicity (no external dependencies).
+    Get character n-grams (trigrams by default) of the first N characters, lowercased.
     
     Args:
-        text1: First text
-        text2: Second text
-        max_chars: Max characters to compare
+        text: Text to split
+        max_chars: Max characters to use
+        n: N-gram length
     
     Returns:
-        Similarity score (0.0-1.0)
+        Set of n-grams (empty for empty/short text)
     """
-    if not text1 or not text2:
-        return 0.0
-    
-    # Truncate and normalize
-    text1 = text1[:max_chars].lower()
-    text2 = text2[:max_chars].lower()
-    
-    # Create character n-grams (n=3 for trigrams)
-    def get_ngrams(text, n=3):
-        """Get character n-grams."""
-        ngrams = set()
-        for i in range(len(text) - n + 1):
-            ngrams.add(text[i:i+n])
-        return ngrams
-    
-    ngrams1 = get_ngrams(text1)
-    ngrams2 = get_ngrams(text2)
+    if not text:
+        return frozenset()
+    text = text[:max_chars].lower()
+    return frozenset(text[i:i + n] for i in range(len(text) - n + 1))
+
+
+def ngram_similarity(ngrams1: frozenset, ngrams2: frozenset) -> float:
+    """
+    Jaccard similarity of two n-gram sets (see get_text_ngrams).
     
+    Returns:
+        Similarity score (0.0-1.0)
+    """
     if not ngrams1 or not ngrams2:
         return 0.0
     
     # Jaccard similarity (simpler than cosine, but effective)
     intersection = len(ngrams1 & ngrams2)
-    union = len(ngrams1 | ngrams2)
+    return intersection / (len(ngrams1) + len(ngrams2) - intersection)
+
+
+def calculate_text_similarity(text1: str, text2: str, max_chars: int = 200) -> float:
+    """
+    Calculate Jaccard similarity between first N characters of two texts.
+    
+    Uses character n-grams for simplicity (no external dependencies).
+    To compare one text against many, build each side once with
+    get_text_ngrams and call ngram_similarity.
     
-    similarity = intersection / union if union > 0 else 0.0
+    Args:
+        text1: First text
+        text2: Second text
+        max_chars: Max characters to compare
     
-    return similarity
+    Returns:
+        Similarity score (0.0-1.0)
+    """
+    return ngram_similarity(get_text_ngrams(text1, max_chars), get_text_ngrams(text2, max_chars))
 
@@ -7,6 +7,7 @@ from datetime import datetime, timezone
 from zoneinfo import ZoneInfo
 from typing import Optional
 from collections import defaultdict
+import functools
 import time
 import structlog
 
@@ -47,6 +48,12 @@ class RateLimitedLogger:
 _tz_logger = RateLimitedLogger(cooldown_seconds=60)
 
 
+@functools.lru_cache(maxsize=64)
+def get_zone(tz_name: str) -> ZoneInfo:
+    """Get ZoneInfo for tz_name (cached: one lookup per mailbox timezone)."""
+    return ZoneInfo(tz_name)
+
+
 def ensure_aware(dt: datetime, mailbox_tz: str, metrics=None) -> datetime:
     """
     Ensure datetime is timezone-aware.
@@ -73,7 +80,7 @@ def ensure_aware(dt: datetime, mailbox_tz: str, metrics=None) -> datetime:
         return dt
     
     # Naive datetime - localize to mailbox timezone
-    mailbox_zone = ZoneInfo(mailbox_tz)
+    mailbox_zone = get_zone(mailbox_tz)
     
     # Record metric
     if metrics:
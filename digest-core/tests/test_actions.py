@@ -258,6 +258,20 @@ class TestMultipleActions:
             # First action should have highest confidence
             assert actions[0].confidence >= actions[1].confidence
 
+    
+    def test_repeated_text_reuses_cached_result(self, extractor):
+        """Test repeated bodies get fresh actions stamped with their own msg_id."""
+        text = "Иван Петров, пожалуйста, проверьте отчет до пятницы."
+        first = extractor.extract_mentions_actions(text, "msg-024", "manager@corp.com")
+        first[0].evidence_id = "ev-1"
+        second = extractor.extract_mentions_actions(text, "msg-025", "manager@corp.com")
+        
+        assert len(second) == len(first) > 0
+        assert second[0].msg_id == "msg-025"
+        assert first[0].msg_id == "msg-024"
+        assert second[0].evidence_id == ""
+        assert second[0].confidence == first[0].confidence
+
 
 class TestEnrichWithEvidence:
     """Test enrichment with evidence IDs."""
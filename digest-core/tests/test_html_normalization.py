@@ -256,7 +256,7 @@ class TestUnicodeNormalization:
         normalizer = HTMLNormalizer()
         
         # Use various unicode quote characters
-        html = '<p>He said "Hello" and she replied 'Yes'</p>'
+        html = '<p>He said \u201CHello\u201D and she replied \u2018Yes\u2019</p>'
         text, success = normalizer.html_to_text(html)
         
         assert success is True
@@ -337,6 +337,38 @@ class TestFallbackMechanisms:
         assert success is True
 
 
+class TestPlainTextBodies:
+    """Test that plain-text bodies pass through the parser without losing text."""
+
+    def test_bare_less_than_kept(self):
+        """Test a bare "<" in prose is not treated as a tag opener."""
+        normalizer = HTMLNormalizer()
+
+        text, success = normalizer.html_to_text("if a<b then do the thing\n\nThanks, Bob")
+
+        assert success is True
+        assert "a<b then do the thing" in text
+        assert "Thanks, Bob" in text
+
+    def test_trailing_less_than_kept(self):
+        """Test a "<" near the end of the body is kept."""
+        normalizer = HTMLNormalizer()
+
+        text, success = normalizer.html_to_text("x<y")
+
+        assert success is True
+        assert text == "x<y"
+
+    def test_nul_byte_not_replaced(self):
+        """Test NUL bytes are not turned into U+FFFD."""
+        normalizer = HTMLNormalizer()
+
+        text, success = normalizer.html_to_text("a\x00b")
+
+        assert success is True
+        assert "�" not in text
+
+
 class TestMetricsIntegration:
     """Test metrics recording."""
     
@@ -9,7 +9,7 @@ Coverage:
 - Precision maintenance: ≤3 п.п. drop
 """
 import pytest
-from digest_core.evidence.lemmatizer import LightweightLemmatizer
+from digest_core.evidence.lemmatizer import LightweightLemmatizer, get_lemmatizer
 from digest_core.evidence.actions import ActionMentionExtractor
 
 
@@ -86,6 +86,40 @@ class TestLightweightLemmatizer:
         
         assert lemmatizer.lemmatize_token("deployed", "en") == "deploy"
         assert lemmatizer.lemmatize_token("задеплой", "ru") == "задеплоить"
+
+    def test_custom_verbs_do_not_leak_into_shared_tables(self):
+        """Test built-in tables are shared, and custom verbs stay per-instance."""
+        custom = LightweightLemmatizer(custom_verbs={'deployed': 'deploy'})
+        first = LightweightLemmatizer()
+        second = LightweightLemmatizer()
+
+        assert first.en_verb_table is second.en_verb_table
+        assert custom.en_verb_table is not first.en_verb_table
+        assert 'deployed' not in first.en_verb_table
+        assert first.lemmatize_token("deployed", "en") == "deployed"
+
+    def test_shared_tables_are_read_only(self):
+        """Test one instance cannot mutate the built-in tables of the others."""
+        lemmatizer = LightweightLemmatizer()
+
+        with pytest.raises(TypeError):
+            lemmatizer.en_verb_table['zzz'] = 'qqq'
+        with pytest.raises(TypeError):
+            lemmatizer.ru_verb_table['zzz'] = 'qqq'
+
+        assert 'zzz' not in LightweightLemmatizer().en_verb_table
+
+        # Custom-verb instances get their own mutable copies
+        custom = LightweightLemmatizer(custom_verbs={'deployed': 'deploy'})
+        custom.en_verb_table['zzz'] = 'qqq'
+        assert 'zzz' not in LightweightLemmatizer().en_verb_table
+
+    def test_get_lemmatizer_shared_per_custom_verbs(self):
+        """Test get_lemmatizer returns one shared instance per custom verb set."""
+        assert get_lemmatizer() is get_lemmatizer()
+        custom = get_lemmatizer((('deployed', 'deploy'),))
+        assert custom is not get_lemmatizer()
+        assert custom.lemmatize_token("deployed", "en") == "deploy"
     
     def test_imperative_rules_ru(self):
         """Test Russian imperative rules."""
@@ -127,6 +161,21 @@ class TestLightweightLemmatizer:
         assert "checking" in forms
         assert "checks" in forms
 
+    def test_lemma_cache(self):
+        """Test memoized lemmas: auto resolves to the same entry, size is bounded."""
+        lemmatizer = LightweightLemmatizer()
+
+        assert lemmatizer.lemmatize_token("Checking", "auto") == "check"
+        assert lemmatizer.lemmatize_token("checking", "en") == "check"
+        assert list(lemmatizer._lemma_cache) == [("checking", "en")]
+
+        lemmatizer.LEMMA_CACHE_SIZE = 2
+        lemmatizer.lemmatize_token("проверь", "ru")
+        lemmatizer.lemmatize_token("sent", "en")
+        assert len(lemmatizer._lemma_cache) == 2
+        assert ("checking", "en") not in lemmatizer._lemma_cache
+        assert lemmatizer.lemmatize_token("checking", "en") == "check"
+
 
 class TestActionExtractionWithLemmatization:
     """Test action extraction with lemmatization."""
@@ -4,12 +4,20 @@ Tests for normalization functionality.
 import pytest
 from digest_core.normalize.html import HTMLNormalizer
 from digest_core.normalize.quotes import QuoteCleaner
+from digest_core.normalize.batch import normalize_batch
 
+# Over the 200KB body limit; built once at import
+BIG_TEXT = "x" * 300_000
 
-def test_html_to_text():
+
+@pytest.fixture(scope="module")
+def normalizer():
+    """HTMLNormalizer shared by the module (stateless between calls)."""
+    return HTMLNormalizer()
+
+
+def test_html_to_text(normalizer):
     """Test HTML to text conversion."""
-    normalizer = HTMLNormalizer()
-    
     html = "<html><body><p>Hello <b>world</b>!</p></body></html>"
     text = normalizer.html_to_text(html)
     
@@ -18,10 +26,8 @@ def test_html_to_text():
     assert "<b>" not in text
 
 
-def test_style_removal():
+def test_style_removal(normalizer):
     """Test that style tags are removed."""
-    normalizer = HTMLNormalizer()
-    
     html = "<html><style>body { color: red; }</style><body>Content</body></html>"
     text = normalizer.html_to_text(html)
     
@@ -29,28 +35,50 @@ def test_style_removal():
     assert "Content" in text
 
 
-def test_tracking_pixel_removal():
+def test_tracking_pixel_removal(normalizer):
     """Test that tracking pixels are removed."""
-    normalizer = HTMLNormalizer()
-    
     html = '<img src="cid:tracker" width="1" height="1">Content'
     text = normalizer.html_to_text(html)
     
     assert "Content" in text
 
 
-def test_truncate_large_text():
+def test_truncate_large_text(normalizer):
     """Test that large texts are truncated."""
-    normalizer = HTMLNormalizer()
-    
-    # Create text larger than 200KB
-    large_text = "x" * 300000
-    truncated = normalizer.truncate_text(large_text, max_bytes=200000)
+    # Text larger than 200KB
+    truncated = normalizer.truncate_text(BIG_TEXT, max_bytes=200000)
     
-    assert len(truncated.encode('utf-8')) <= 200000 + 100  # Allow for marker
+    # ASCII in, ASCII marker out: char length is byte length, no re-encode
+    assert truncated.isascii()
+    assert len(truncated) <= 200000 + len("\n[TRUNCATED]")
     assert "[TRUNCATED]" in truncated
 
 
+def test_truncate_multibyte_text(normalizer):
+    """Test truncation of 2-byte UTF-8 text never splits a character."""
+    # 150k Cyrillic chars = 300KB in UTF-8; odd limit falls mid-character
+    truncated = normalizer.truncate_text("я" * 150000, max_bytes=200001)
+
+    assert truncated.startswith("я" * 100000)
+    assert truncated.endswith("\n[TRUNCATED]")
+    assert normalizer.truncate_text("я" * 100, max_bytes=200) == "я" * 100
+
+
+def test_normalize_batch_parallel_matches_serial():
+    """Test process-pool normalization returns the same results, in order."""
+    htmls = [
+        f"Message {i}\nPlease review by Friday.\n\n> Old {i}\n> quoted text"
+        for i in range(40)
+    ]
+
+    serial = normalize_batch(htmls, workers=1)
+    parallel = normalize_batch(htmls, workers=2)
+
+    assert [body for body, _ in parallel] == [body for body, _ in serial]
+    assert [len(spans) for _, spans in parallel] == [len(spans) for _, spans in serial]
+    assert "Message 7" in parallel[7][0]
+
+
 def test_quote_cleaning():
     """Test quote cleaning."""
     cleaner = QuoteCleaner()
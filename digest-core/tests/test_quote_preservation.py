@@ -4,11 +4,32 @@ Tests for quote preservation in QuoteCleaner.
 import pytest
 from digest_core.normalize.quotes import QuoteCleaner
 
+# 15-line top quote, built once at import
+QUOTE_15LINES = "\n".join(f"> Line {i+1} of quoted content." for i in range(15))
+EMAIL_15LINES = f"""Reply here.
+
+On Mon wrote:
+{QUOTE_15LINES}
+
+End."""
+
+
+@pytest.fixture(scope="class")
+def cleaner_keep():
+    """QuoteCleaner keeping the top quote head, shared per test class."""
+    return QuoteCleaner(keep_top_quote_head=True)
+
+
+@pytest.fixture(scope="class")
+def cleaner_legacy():
+    """QuoteCleaner in legacy mode (removes all quotes), shared per test class."""
+    return QuoteCleaner(keep_top_quote_head=False)
+
 
 class TestQuotePreservation:
     """Test suite for top-level quote preservation."""
     
-    def test_inline_reply_with_task_preserved(self):
+    def test_inline_reply_with_task_preserved(self, cleaner_keep):
         """Test that task/instruction in top-level quote is preserved."""
         email_text = """Hi team,
 
@@ -23,8 +44,7 @@ On Mon, Dec 4, 2023 at 10:30 AM John Doe <john@example.com> wrote:
 Thanks,
 Boss"""
         
-        cleaner = QuoteCleaner(keep_top_quote_head=True)
-        result = cleaner.clean_quotes(email_text)
+        result = cleaner_keep.clean_quotes(email_text)
         
         # Check that top quote is preserved with marker
         assert '[Quoted head retained]' in result
@@ -36,7 +56,7 @@ Boss"""
         assert 'Thanks,' in result
         assert 'Boss' in result
     
-    def test_multilevel_quotes_only_top_preserved(self):
+    def test_multilevel_quotes_only_top_preserved(self, cleaner_keep):
         """Test that only top-level quote is kept, deep quotes removed."""
         email_text = """Agreed, let's proceed.
 
@@ -49,8 +69,7 @@ From: Alice <alice@example.com>
 
 Regards"""
         
-        cleaner = QuoteCleaner(keep_top_quote_head=True)
-        result = cleaner.clean_quotes(email_text)
+        result = cleaner_keep.clean_quotes(email_text)
         
         # Top-level quote preserved
         assert '[Quoted head retained]' in result
@@ -61,7 +80,7 @@ Regards"""
         assert 'option A vs B' not in result
         assert 'option C' not in result
     
-    def test_legacy_mode_removes_all_quotes(self):
+    def test_legacy_mode_removes_all_quotes(self, cleaner_legacy):
         """Test that legacy mode (keep_top_quote_head=False) removes all quotes."""
         email_text = """New reply here.
 
@@ -71,8 +90,7 @@ On Mon Dec 4 2023 John wrote:
 
 End of email."""
         
-        cleaner = QuoteCleaner(keep_top_quote_head=False)
-        result = cleaner.clean_quotes(email_text)
+        result = cleaner_legacy.clean_quotes(email_text)
         
         # No quotes preserved
         assert '[Quoted head retained]' not in result
@@ -83,7 +101,7 @@ End of email."""
         assert 'New reply here' in result
         assert 'End of email' in result
     
-    def test_russian_quote_header_preserved(self):
+    def test_russian_quote_header_preserved(self, cleaner_keep):
         """Test Russian quote headers (От:, Дата:) are recognized."""
         email_text = """Согласен, делаем так.
 
@@ -94,14 +112,13 @@ End of email."""
 
 Спасибо."""
         
-        cleaner = QuoteCleaner(keep_top_quote_head=True)
-        result = cleaner.clean_quotes(email_text)
+        result = cleaner_keep.clean_quotes(email_text)
         
         assert '[Quoted head retained]' in result
         assert '> Прошу согласовать бюджет' in result
         assert '> Срок: до пятницы.' in result
     
-    def test_quote_truncation_after_2_paragraphs(self):
+    def test_quote_truncation_after_2_paragraphs(self, cleaner_keep):
         """Test that quote is truncated after 2 paragraphs."""
         email_text = """Got it.
 
@@ -116,8 +133,7 @@ On Mon Dec 4 wrote:
 
 Thanks."""
         
-        cleaner = QuoteCleaner(keep_top_quote_head=True)
-        result = cleaner.clean_quotes(email_text)
+        result = cleaner_keep.clean_quotes(email_text)
         
         # First 2 paragraphs preserved
         assert '> Paragraph 1: First important point here.' in result
@@ -127,18 +143,9 @@ Thanks."""
         assert 'Paragraph 3' not in result
         assert 'Paragraph 4' not in result
     
-    def test_quote_truncation_after_10_lines(self):
+    def test_quote_truncation_after_10_lines(self, cleaner_keep):
         """Test that quote is truncated after 10 lines."""
-        quote_lines = '\n'.join([f'> Line {i+1} of quoted content.' for i in range(15)])
-        email_text = f"""Reply here.
-
-On Mon wrote:
-{quote_lines}
-
-End."""
-        
-        cleaner = QuoteCleaner(keep_top_quote_head=True)
-        result = cleaner.clean_quotes(email_text)
+        result = cleaner_keep.clean_quotes(EMAIL_15LINES)
         
         # Some lines preserved
         assert '> Line 1 of quoted content.' in result
@@ -147,7 +154,7 @@ End."""
         # Lines beyond 10 should be removed
         assert 'Line 15 of quoted content' not in result
     
-    def test_no_quotes_no_marker_added(self):
+    def test_no_quotes_no_marker_added(self, cleaner_keep):
         """Test that emails without quotes don't get markers."""
         email_text = """Just a simple email.
 
@@ -156,13 +163,12 @@ No quotes here at all.
 Regards,
 John"""
         
-        cleaner = QuoteCleaner(keep_top_quote_head=True)
-        result = cleaner.clean_quotes(email_text)
+        result = cleaner_keep.clean_quotes(email_text)
         
         assert '[Quoted head retained]' not in result
         assert result.strip() == email_text.strip()
     
-    def test_forward_marker_triggers_deep_quote(self):
+    def test_forward_marker_triggers_deep_quote(self, cleaner_keep):
         """Test that -----Original Message----- triggers deep quote removal."""
         email_text = """FYI, see below.
 
@@ -176,8 +182,7 @@ This should be removed as deep quote.
 
 Thanks."""
         
-        cleaner = QuoteCleaner(keep_top_quote_head=True)
-        result = cleaner.clean_quotes(email_text)
+        result = cleaner_keep.clean_quotes(email_text)
         
         # Deep quote removed
         assert 'Original Message' not in result
@@ -186,7 +191,7 @@ Thanks."""
         # Top content preserved
         assert 'FYI, see below' in result
     
-    def test_quote_length_growth_minimal(self):
+    def test_quote_length_growth_minimal(self, cleaner_keep):
         """Test that preserved quotes don't significantly increase text length."""
         # Email with moderate top quote
         email_text = """Action: Please approve this.
@@ -197,13 +202,12 @@ On Mon wrote:
 
 Thanks!"""
         
-        cleaner = QuoteCleaner(keep_top_quote_head=True)
-        result = cleaner.clean_quotes(email_text)
+        result = cleaner_keep.clean_quotes(email_text)
         
-        # Calculate length growth
-        original_len = len(email_text)
-        result_len = len(result)
-        growth = (result_len - original_len) / original_len
+        # Calculate length growth in UTF-8 bytes (what is stored and sent)
+        original_bytes = len(email_text.encode('utf-8'))
+        result_bytes = len(result.encode('utf-8'))
+        growth = (result_bytes - original_bytes) / original_bytes
         
         # Growth should be minimal (mostly from marker "[Quoted head retained]")
         assert growth < 0.15  # Less than 15% growth
@@ -215,26 +219,24 @@ Thanks!"""
 class TestQuoteCleaningEdgeCases:
     """Test edge cases and special scenarios."""
     
-    def test_empty_text(self):
+    def test_empty_text(self, cleaner_keep):
         """Test handling of empty text."""
-        cleaner = QuoteCleaner(keep_top_quote_head=True)
-        assert cleaner.clean_quotes('') == ''
-        assert cleaner.clean_quotes(None) == None
+        assert cleaner_keep.clean_quotes('') == ''
+        assert cleaner_keep.clean_quotes(None) == None
     
-    def test_only_quote_no_reply(self):
+    def test_only_quote_no_reply(self, cleaner_keep):
         """Test email that is only a quote (forward without comment)."""
         email_text = """On Mon wrote:
 > This is the entire content.
 > No reply above."""
         
-        cleaner = QuoteCleaner(keep_top_quote_head=True)
-        result = cleaner.clean_quotes(email_text)
+        result = cleaner_keep.clean_quotes(email_text)
         
         # Top quote preserved even if it's all there is
         assert '[Quoted head retained]' in result
         assert '> This is the entire content.' in result
     
-    def test_signature_removal_still_works(self):
+    def test_signature_removal_still_works(self, cleaner_keep):
         """Test that signature removal still works with quote preservation."""
         email_text = """Let's do it.
 
@@ -245,8 +247,7 @@ Best regards,
 John Doe
 Sent from my iPhone"""
         
-        cleaner = QuoteCleaner(keep_top_quote_head=True)
-        result = cleaner.clean_quotes(email_text)
+        result = cleaner_keep.clean_quotes(email_text)
         
         # Quote preserved
         assert '> Original request here.' in result
@@ -9,25 +9,64 @@ Coverage:
 """
 import pytest
 from datetime import datetime, timedelta, timezone
+from digest_core.evidence.split import EvidenceChunk
 from digest_core.select.ranker import DigestRanker, RankingFeatures
 from digest_core.llm.schemas import ActionItem, DeadlineMeeting, ExtractedActionItem, Citation
-from digest_core.evidence.split import EvidenceChunk
+
+
+# Fixed reference time for chunk timestamps and the ranker's clock
+NOW = datetime(2024, 6, 1, 12, 0, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def now(monkeypatch):
+    """Freeze the ranker's clock at NOW."""
+    monkeypatch.setattr('digest_core.select.ranker._now', lambda: NOW)
+    return NOW
+
+
+class _RankedChunk(EvidenceChunk):
+    """EvidenceChunk plus the thread_id/timestamp attributes DigestRanker reads when present."""
+
+
+_BASE_CHUNK = _RankedChunk(
+    evidence_id="ev1",
+    conversation_id="conv-1",
+    content="Test",
+    source_ref={"msg_id": "msg-1", "start": 0, "end": 100, "type": "email"},
+    token_count=50,
+    priority_score=1.0,
+    message_metadata={"sender": "sender@example.com", "subject": "Test"},
+    addressed_to_me=False,
+    user_aliases_matched=[],
+    signals={},
+)
+
+
+@pytest.fixture(scope="module")
+def chunk_factory():
+    """Factory for evidence chunks: a real EvidenceChunk with per-test field overrides."""
+    def make(sender=None, thread_id=None, timestamp=NOW.isoformat(), message_metadata=None, **fields):
+        metadata = {**_BASE_CHUNK.message_metadata, **(message_metadata or {})}
+        if sender is not None:
+            metadata["sender"] = sender
+        chunk = _BASE_CHUNK._replace(message_metadata=metadata, **fields)
+        chunk.thread_id = thread_id
+        chunk.timestamp = timestamp
+        return chunk
+    
+    return make
 
 
 class TestRankingFeatures:
     """Test feature extraction and scoring."""
     
-    def test_feature_extraction_user_in_to(self):
+    def test_feature_extraction_user_in_to(self, chunk_factory):
         """Test that user in To recipients increases score."""
         ranker = DigestRanker(user_aliases=["user@example.com"])
         
         # Create mock evidence chunk with user in To
-        chunk = EvidenceChunk(
-            evidence_id="ev1",
-            msg_id="msg1",
-            text="Test content",
-            sender="sender@example.com",
-            timestamp=datetime.now(timezone.utc).isoformat(),
+        chunk = chunk_factory(
             message_metadata={
                 "to_recipients": ["user@example.com", "other@example.com"],
                 "cc_recipients": [],
@@ -47,16 +86,11 @@ class TestRankingFeatures:
         assert features.user_in_to is True
         assert features.user_in_cc is False
     
-    def test_feature_extraction_user_in_cc(self):
+    def test_feature_extraction_user_in_cc(self, chunk_factory):
         """Test that user in CC recipients increases score (but less than To)."""
         ranker = DigestRanker(user_aliases=["user@example.com"])
         
-        chunk = EvidenceChunk(
-            evidence_id="ev1",
-            msg_id="msg1",
-            text="Test content",
-            sender="sender@example.com",
-            timestamp=datetime.now(timezone.utc).isoformat(),
+        chunk = chunk_factory(
             message_metadata={
                 "to_recipients": ["other@example.com"],
                 "cc_recipients": ["user@example.com"],
@@ -93,18 +127,11 @@ class TestRankingFeatures:
         # Test no markers
         assert ranker._has_action_markers("Just FYI, project is going well") is False
     
-    def test_feature_extraction_due_date(self):
+    def test_feature_extraction_due_date(self, chunk_factory):
         """Test detection of due dates."""
         ranker = DigestRanker()
         
-        chunk = EvidenceChunk(
-            evidence_id="ev1",
-            msg_id="msg1",
-            text="Test content",
-            sender="sender@example.com",
-            timestamp=datetime.now(timezone.utc).isoformat(),
-            message_metadata={"subject": "Test"}
-        )
+        chunk = chunk_factory()
         
         # Item with due date
         item_with_due = DeadlineMeeting(
@@ -133,33 +160,34 @@ class TestRankingFeatures:
     def test_feature_extraction_sender_importance(self):
         """Test sender importance scoring."""
         ranker = DigestRanker(
-            important_senders=["ceo@example.com", "manager@"]
+            important_senders=["ceo@example.com", "manager"]
         )
         
         # Exact match
         assert ranker._calculate_sender_importance("ceo@example.com") == 1.0
         
-        # Partial domain match
-        assert ranker._calculate_sender_importance("john@manager@company.com") >= 0.7
+        # Same domain as an important address
+        assert ranker._calculate_sender_importance("cfo@example.com") == 0.8
+        
+        # Partial domain match (keyword)
+        assert ranker._calculate_sender_importance("john@manager.company.com") == 0.7
         
         # No match (default)
-        assert ranker._calculate_sender_importance("random@example.com") == 0.5
+        assert ranker._calculate_sender_importance("random@other.org") == 0.5
     
-    def test_feature_extraction_thread_length(self):
+    def test_sender_domain_match_beats_keyword(self):
+        """Test same-domain score (0.8) wins regardless of important_senders order."""
+        for important_senders in (["example", "boss@example.com"], ["boss@example.com", "example"]):
+            ranker = DigestRanker(important_senders=important_senders)
+            assert ranker._calculate_sender_importance("peer@example.com") == 0.8
+    
+    def test_feature_extraction_thread_length(self, chunk_factory):
         """Test thread length scoring."""
         ranker = DigestRanker()
         
         # Create multiple chunks in same thread
         chunks = [
-            EvidenceChunk(
-                evidence_id=f"ev{i}",
-                msg_id=f"msg{i}",
-                text="Content",
-                sender="sender@example.com",
-                timestamp=datetime.now(timezone.utc).isoformat(),
-                message_metadata={"subject": "Test"},
-                thread_id="thread1"
-            )
+            chunk_factory(evidence_id=f"ev{i}", thread_id="thread1")
             for i in range(5)
         ]
         
@@ -174,21 +202,29 @@ class TestRankingFeatures:
         features = ranker._extract_features(item, chunks)
         assert features.thread_length == 5
     
-    def test_feature_extraction_recency(self):
+    def test_feature_extraction_recency(self, chunk_factory, now):
         """Test recency scoring."""
         ranker = DigestRanker()
         
         # Recent message (1 hour ago)
-        recent_time = datetime.now(timezone.utc) - timedelta(hours=1)
-        chunk_recent = EvidenceChunk(
+        recent_time = now - timedelta(hours=1)
+        chunk_recent = chunk_factory(timestamp=recent_time.isoformat())
+        
+        item = ActionItem(
+            title="Action",
+            description="Do something",
             evidence_id="ev1",
-            msg_id="msg1",
-            text="Content",
-            sender="sender@example.com",
-            timestamp=recent_time.isoformat(),
-            message_metadata={"subject": "Test"}
+            quote="Test",
+            confidence="High"
         )
         
+        features = ranker._extract_features(item, [chunk_recent])
+        assert features.hours_since_received == 1.0  # measured against the frozen NOW
+    
+    def test_recency_uses_ranker_clock(self, chunk_factory, now, monkeypatch):
+        """Test hours_since_received is measured from the ranker's clock, not wall time."""
+        ranker = DigestRanker()
+        chunk = chunk_factory(timestamp=(NOW - timedelta(hours=30)).isoformat())
         item = ActionItem(
             title="Action",
             description="Do something",
@@ -197,19 +233,17 @@ class TestRankingFeatures:
             confidence="High"
         )
         
-        features = ranker._extract_features(item, [chunk_recent])
-        assert features.hours_since_received < 2.0
+        assert ranker._extract_features(item, [chunk]).hours_since_received == 30.0
+        
+        # Moving the clock moves the recency reference with it
+        monkeypatch.setattr('digest_core.select.ranker._now', lambda: NOW + timedelta(hours=6))
+        assert ranker._extract_features(item, [chunk]).hours_since_received == 36.0
     
-    def test_feature_extraction_attachments(self):
+    def test_feature_extraction_attachments(self, chunk_factory):
         """Test attachment detection."""
         ranker = DigestRanker()
         
-        chunk_with_attachments = EvidenceChunk(
-            evidence_id="ev1",
-            msg_id="msg1",
-            text="Content",
-            sender="sender@example.com",
-            timestamp=datetime.now(timezone.utc).isoformat(),
+        chunk_with_attachments = chunk_factory(
             message_metadata={
                 "subject": "Test",
                 "has_attachments": True
@@ -227,7 +261,7 @@ class TestRankingFeatures:
         features = ranker._extract_features(item, [chunk_with_attachments])
         assert features.has_attachments is True
     
-    def test_feature_extraction_project_tags(self):
+    def test_feature_extraction_project_tags(self, chunk_factory):
         """Test project tag detection (JIRA, etc.)."""
         ranker = DigestRanker()
         
@@ -242,14 +276,7 @@ class TestRankingFeatures:
         ]
         
         for subject, expected in test_subjects:
-            chunk = EvidenceChunk(
-                evidence_id="ev1",
-                msg_id="msg1",
-                text="Content",
-                sender="sender@example.com",
-                timestamp=datetime.now(timezone.utc).isoformat(),
-                message_metadata={"subject": subject}
-            )
+            chunk = chunk_factory(message_metadata={"subject": subject})
             
             item = ActionItem(
                 title="Action",
@@ -305,18 +332,14 @@ class TestRankingFeatures:
 class TestRankerIntegration:
     """Integration tests: actionable items should rank higher."""
     
-    def test_rank_items_basic(self):
+    def test_rank_items_basic(self, chunk_factory, now):
         """Test basic ranking of items."""
         ranker = DigestRanker(user_aliases=["user@example.com"])
         
-        now = datetime.now(timezone.utc)
-        
         # Create chunks
         chunks = [
-            EvidenceChunk(
+            chunk_factory(
                 evidence_id="ev1",
-                msg_id="msg1",
-                text="Please review this urgently",
                 sender="ceo@example.com",
                 timestamp=now.isoformat(),
                 message_metadata={
@@ -325,10 +348,8 @@ class TestRankerIntegration:
                     "subject": "[JIRA-123] Critical review needed"
                 }
             ),
-            EvidenceChunk(
+            chunk_factory(
                 evidence_id="ev2",
-                msg_id="msg2",
-                text="Just FYI, project status update",
                 sender="other@example.com",
                 timestamp=(now - timedelta(days=2)).isoformat(),
                 message_metadata={
@@ -368,16 +389,12 @@ class TestRankerIntegration:
         # Check scores
         assert ranked[0].rank_score > ranked[1].rank_score
     
-    def test_rank_items_with_extracted_actions(self):
+    def test_rank_items_with_extracted_actions(self, chunk_factory, now):
         """Test ranking of ExtractedActionItem."""
         ranker = DigestRanker(user_aliases=["user@example.com"])
         
-        now = datetime.now(timezone.utc)
-        
-        chunk = EvidenceChunk(
+        chunk = chunk_factory(
             evidence_id="ev1",
-            msg_id="msg1",
-            text="User, can you send me the report by Friday?",
             sender="manager@example.com",
             timestamp=now.isoformat(),
             message_metadata={
@@ -401,18 +418,14 @@ class TestRankerIntegration:
         # Should have high score (action, direct mention, due date, direct recipient)
         assert ranked[0].rank_score > 0.5
     
-    def test_top_n_actions_share(self):
+    def test_top_n_actions_share(self, chunk_factory, now):
         """Test calculation of top-N actions share."""
         ranker = DigestRanker()
         
-        now = datetime.now(timezone.utc)
-        
         # Create chunks
         chunks = [
-            EvidenceChunk(
+            chunk_factory(
                 evidence_id=f"ev{i}",
-                msg_id=f"msg{i}",
-                text="Content",
                 sender="sender@example.com",
                 timestamp=now.isoformat(),
                 message_metadata={"subject": "Test"}
@@ -449,7 +462,7 @@ class TestRankerIntegration:
         # Should be 0.7 (7 out of 10)
         assert 0.6 <= share <= 0.8
     
-    def test_rank_with_custom_weights(self):
+    def test_rank_with_custom_weights(self, chunk_factory, now):
         """Test ranking with custom weights."""
         # Emphasize recency
         weights = {
@@ -466,21 +479,15 @@ class TestRankerIntegration:
         }
         ranker = DigestRanker(weights=weights)
         
-        now = datetime.now(timezone.utc)
-        
         chunks = [
-            EvidenceChunk(
+            chunk_factory(
                 evidence_id="ev_old",
-                msg_id="msg_old",
-                text="Old message",
                 sender="sender@example.com",
                 timestamp=(now - timedelta(days=5)).isoformat(),
                 message_metadata={"subject": "Old"}
             ),
-            EvidenceChunk(
+            chunk_factory(
                 evidence_id="ev_new",
-                msg_id="msg_new",
-                text="Recent message",
                 sender="sender@example.com",
                 timestamp=now.isoformat(),
                 message_metadata={"subject": "New"}
@@ -516,7 +523,7 @@ class TestRankerIntegration:
         ranked = ranker.rank_items([], [])
         assert ranked == []
     
-    def test_rank_items_no_matching_evidence(self):
+    def test_rank_items_no_matching_evidence(self, chunk_factory, now):
         """Test ranking when evidence_id doesn't match any chunks."""
         ranker = DigestRanker()
         
@@ -528,12 +535,10 @@ class TestRankerIntegration:
             confidence="High"
         )
         
-        chunk = EvidenceChunk(
+        chunk = chunk_factory(
             evidence_id="ev1",
-            msg_id="msg1",
-            text="Content",
             sender="sender@example.com",
-            timestamp=datetime.now(timezone.utc).isoformat(),
+            timestamp=now.isoformat(),
             message_metadata={"subject": "Test"}
         )
         
@@ -1,23 +1,26 @@
 """
 Tests for fallback to stdlib re when regex module is unavailable.
 """
-import sys
 import pytest
+from digest_core.evidence import signals, split
 
 
-def test_fallback_when_regex_unavailable(monkeypatch):
+@pytest.fixture
+def stdlib_backend():
+    """Compile signals/split patterns with stdlib re, restoring the backend afterwards."""
+    saved = (signals._HAS_REGEX, split._HAS_REGEX)
+    signals._set_backend(False)
+    split._set_backend(False)
+    yield
+    signals._set_backend(saved[0])
+    split._set_backend(saved[1])
+
+
+def test_fallback_when_regex_unavailable(stdlib_backend):
     """Test that patterns work when regex module is not available."""
-    # Remove regex from sys.modules to simulate it being unavailable
-    if 'regex' in sys.modules:
-        monkeypatch.setitem(sys.modules, 'regex', None)
-    
-    # Force reimport of signals module
-    import importlib
-    from digest_core.evidence import signals
-    importlib.reload(signals)
-    
     # CYRILLIC_WORD should still exist and work
     assert signals.CYRILLIC_WORD is not None
+    assert signals.CYRILLIC_WORD.__class__.__module__ == 're'
     
     # Test basic matching
     test_text = "Пришлите, пожалуйста, до 5 декабря"
@@ -28,16 +31,8 @@ def test_fallback_when_regex_unavailable(monkeypatch):
     assert any("пришлите" in m.lower() for m in matches)
 
 
-def test_fallback_date_extraction(monkeypatch):
+def test_fallback_date_extraction(stdlib_backend):
     """Test that date extraction works with fallback."""
-    # Simulate regex unavailable
-    if 'regex' in sys.modules:
-        monkeypatch.setitem(sys.modules, 'regex', None)
-    
-    import importlib
-    from digest_core.evidence import signals
-    importlib.reload(signals)
-    
     test_text = "до 15 января, к 3 марта"
     dates = signals.extract_dates(test_text)
     
@@ -45,15 +40,8 @@ def test_fallback_date_extraction(monkeypatch):
     assert len(dates) > 0
 
 
-def test_fallback_caps_pattern(monkeypatch):
+def test_fallback_caps_pattern(stdlib_backend):
     """Test that CAPS header pattern works with fallback."""
-    if 'regex' in sys.modules:
-        monkeypatch.setitem(sys.modules, 'regex', None)
-    
-    import importlib
-    from digest_core.evidence import split
-    importlib.reload(split)
-    
     # CAPS_HEADER_PATTERN should work
     assert split.CAPS_HEADER_PATTERN is not None
     
@@ -61,4 +49,3 @@ def test_fallback_caps_pattern(monkeypatch):
     assert split.CAPS_HEADER_PATTERN.match("ЗАГОЛОВОК: ")
     assert split.CAPS_HEADER_PATTERN.match("HEADER: ")
     assert not split.CAPS_HEADER_PATTERN.match("not a header")
-
@@ -2,9 +2,66 @@
 Test context selector with scoring and filtering.
 """
 import pytest
-from unittest.mock import Mock
+from datetime import datetime, timedelta, timezone
+from types import MappingProxyType
 from digest_core.select.context import ContextSelector
 from digest_core.evidence.split import EvidenceChunk
+from digest_core.config import ContextBudgetConfig
+
+
+# Fixed reference time for recency scoring
+NOW = datetime(2024, 1, 15, 12, 0, tzinfo=timezone.utc)
+
+# Shared read-only defaults: the selector only reads metadata and signals
+_BASE_METADATA = MappingProxyType({
+    'from': 'user@company.com',
+    'subject': 'Regular business email',
+    'received_at': NOW.isoformat(),
+    'importance': 'Normal',
+    'is_flagged': False,
+    'has_attachments': False,
+    'attachment_types': [],
+})
+
+_BASE_SIGNALS = MappingProxyType({
+    'action_verbs': [],
+    'dates': [],
+    'contains_question': False,
+    'sender_rank': 1,
+})
+
+_BASE_CHUNK = EvidenceChunk(
+    evidence_id='ev-base',
+    conversation_id='thread-base',
+    content='Regular business email',
+    source_ref={'msg_id': 'msg-base', 'start': 0, 'end': 100, 'type': 'email'},
+    token_count=50,
+    priority_score=1.0,
+    message_metadata=_BASE_METADATA,
+    addressed_to_me=False,
+    user_aliases_matched=[],
+    signals=_BASE_SIGNALS,
+)
+
+
+def make_chunk(evidence_id, content='Regular business email', token_count=50,
+               priority_score=1.0, metadata=None, signals=None):
+    """Evidence chunk in its own thread, with metadata/signal overrides."""
+    return _BASE_CHUNK._replace(
+        evidence_id=evidence_id,
+        conversation_id=f"thread-{evidence_id}",
+        content=content,
+        source_ref={'msg_id': f"msg-{evidence_id}", 'start': 0, 'end': 100, 'type': 'email'},
+        token_count=token_count,
+        priority_score=priority_score,
+        message_metadata={**_BASE_METADATA, **metadata} if metadata else _BASE_METADATA,
+        signals={**_BASE_SIGNALS, **signals} if signals else _BASE_SIGNALS,
+    )
+
+
+def score_of(selector, chunk):
+    """Enhanced score the selector assigns to a single chunk."""
+    return selector._calculate_enhanced_scores([chunk])[0].priority_score
 
 
 @pytest.fixture
@@ -13,184 +70,132 @@ def selector():
     return ContextSelector()
 
 
-@pytest.fixture
-def sample_threads():
-    """Sample threads for testing."""
-    threads = []
-    
-    # Thread 1: High priority (urgent keywords, recent)
-    thread1 = Mock(spec=Thread)
-    thread1.thread_id = "thread-1"
-    thread1.messages = [
-        Mock(subject="URGENT: Server Down", sender=Mock(email_address="admin@company.com"))
-    ]
-    thread1.latest_message_time = Mock()
-    thread1.message_count = 3
-    threads.append(thread1)
-    
-    # Thread 2: Medium priority (meeting request)
-    thread2 = Mock(spec=Thread)
-    thread2.thread_id = "thread-2"
-    thread2.messages = [
-        Mock(subject="Meeting: Q4 Review", sender=Mock(email_address="manager@company.com"))
-    ]
-    thread2.latest_message_time = Mock()
-    thread2.message_count = 2
-    threads.append(thread2)
-    
-    # Thread 3: Low priority (OOO message)
-    thread3 = Mock(spec=Thread)
-    thread3.thread_id = "thread-3"
-    thread3.messages = [
-        Mock(subject="Out of Office", sender=Mock(email_address="user@company.com"))
+@pytest.fixture(scope="module")
+def sample_evidence():
+    """Sample evidence chunks for testing (read-only, built once per module)."""
+    return [
+        # Evidence 1: High priority (urgent, action verbs, deadline)
+        make_chunk(
+            "ev-1", "URGENT: Server is down, please fix by 16.01.2024", token_count=100,
+            metadata={'importance': 'High'},
+            signals={'action_verbs': ['please', 'urgent'], 'dates': ['16.01.2024']},
+        ),
+        # Evidence 2: Medium priority (meeting question)
+        make_chunk(
+            "ev-2", "Can we schedule the Q4 review next week?", token_count=80,
+            signals={'contains_question': True},
+        ),
+        # Evidence 3: Low priority (auto-reply)
+        make_chunk(
+            "ev-3", "Auto-submitted: I will be out of office until next Monday", token_count=60,
+            metadata={'from': 'noreply@company.com'},
+        ),
     ]
-    thread3.latest_message_time = Mock()
-    thread3.message_count = 1
-    threads.append(thread3)
-    
-    return threads
 
 
-@pytest.fixture
-def sample_evidence():
-    """Sample evidence chunks for testing."""
-    evidence = []
-    
-    # Evidence 1: High priority content
-    chunk1 = Mock(spec=EvidenceChunk)
-    chunk1.evidence_id = "ev-1"
-    chunk1.thread_id = "thread-1"
-    chunk1.content = "URGENT: Server is down, need immediate action"
-    chunk1.token_count = 100
-    evidence.append(chunk1)
-    
-    # Evidence 2: Medium priority content
-    chunk2 = Mock(spec=EvidenceChunk)
-    chunk2.evidence_id = "ev-2"
-    chunk2.thread_id = "thread-2"
-    chunk2.content = "Meeting scheduled for Q4 review next week"
-    chunk2.token_count = 80
-    evidence.append(chunk2)
-    
-    # Evidence 3: Low priority content
-    chunk3 = Mock(spec=EvidenceChunk)
-    chunk3.evidence_id = "ev-3"
-    chunk3.thread_id = "thread-3"
-    chunk3.content = "I will be out of office until next Monday"
-    chunk3.token_count = 60
-    evidence.append(chunk3)
-    
-    return evidence
-
-
-def test_scoring_positive_signals(selector, sample_threads, sample_evidence):
+def test_scoring_positive_signals(selector):
     """Test scoring with positive signals."""
-    # Test urgent keywords
-    score = selector._calculate_positive_signals("URGENT: Server Down", "admin@company.com")
-    assert score > 0
-    
-    # Test meeting keywords
-    score = selector._calculate_positive_signals("Meeting: Q4 Review", "manager@company.com")
-    assert score > 0
-    
-    # Test action keywords
-    score = selector._calculate_positive_signals("Please review and approve", "user@company.com")
-    assert score > 0
-
-
-def test_scoring_negative_signals(selector, sample_threads, sample_evidence):
+    plain = score_of(selector, make_chunk("ev-plain"))
+
+    # Action verbs
+    assert score_of(selector, make_chunk("ev-a", signals={'action_verbs': ['please']})) > plain
+
+    # Questions
+    assert score_of(selector, make_chunk("ev-q", signals={'contains_question': True})) > plain
+
+    # Dates / deadlines
+    assert score_of(selector, make_chunk("ev-d", signals={'dates': ['2024-01-20']})) > plain
+
+    # High importance and flagged
+    assert score_of(selector, make_chunk("ev-i", metadata={'importance': 'High'})) > plain
+    assert score_of(selector, make_chunk("ev-f", metadata={'is_flagged': True})) > plain
+
+    # Document attachments
+    assert score_of(selector, make_chunk("ev-x", metadata={'attachment_types': ['PDF']})) > plain
+
+
+def test_scoring_negative_signals(selector):
     """Test scoring with negative signals."""
-    # Test OOO messages
-    score = selector._calculate_negative_signals("Out of Office", "user@company.com")
-    assert score > 0
-    
-    # Test DSN messages
-    score = selector._calculate_negative_signals("Delivery Status Notification", "system@company.com")
-    assert score > 0
-    
-    # Test auto-replies
-    score = selector._calculate_negative_signals("Auto-reply", "user@company.com")
-    assert score > 0
-
-
-def test_service_mail_filtering(selector, sample_threads, sample_evidence):
-    """Test filtering of service emails."""
-    # Test OOO filtering
-    is_service = selector._is_service_email("Out of Office", "user@company.com")
-    assert is_service
-    
-    # Test DSN filtering
-    is_service = selector._is_service_email("Delivery Status Notification", "system@company.com")
-    assert is_service
-    
-    # Test regular email
-    is_service = selector._is_service_email("Regular business email", "user@company.com")
-    assert not is_service
-
-
-def test_token_budget_respect(selector, sample_threads, sample_evidence):
+    plain = score_of(selector, make_chunk("ev-plain"))
+
+    # noreply sender
+    assert score_of(selector, make_chunk("ev-n", metadata={'from': 'noreply@company.com'})) < plain
+
+    # Delivery status notifications
+    assert score_of(selector, make_chunk("ev-dsn", "Delivery Status Notification (Failure)")) < plain
+
+    # Auto-replies
+    assert score_of(selector, make_chunk("ev-auto", "Auto-submitted: out of office")) < plain
+
+
+def test_service_mail_filtering(selector):
+    """Test detection of service emails (negative priors)."""
+    assert selector._has_negative_prior(make_chunk("ev-1", metadata={'from': 'no-reply@company.com'}))
+    assert selector._has_negative_prior(make_chunk("ev-2", "Click to unsubscribe"))
+    assert selector._has_negative_prior(make_chunk("ev-3", "Статус доставки: не доставлено"))
+
+    # Regular email
+    assert not selector._has_negative_prior(make_chunk("ev-4"))
+
+
+def test_token_budget_respect(sample_evidence):
     """Test that token budget is respected."""
-    max_tokens = 1000
-    
-    selected = selector.select_context(sample_threads, sample_evidence, max_tokens)
-    
+    max_tokens = 200
+    selector = ContextSelector(context_budget_config=ContextBudgetConfig(max_total_tokens=max_tokens))
+
+    selected = selector.select_context(sample_evidence)
+
     total_tokens = sum(chunk.token_count for chunk in selected)
-    assert total_tokens <= max_tokens
+    assert 0 < total_tokens <= max_tokens
+    assert selector.get_metrics()['token_budget_used'] == total_tokens
 
 
-def test_top_k_selection(selector, sample_threads, sample_evidence):
+def test_top_k_selection(selector, sample_evidence):
     """Test top-K selection based on scoring."""
-    max_tokens = 2000
-    
-    selected = selector.select_context(sample_threads, sample_evidence, max_tokens)
-    
-    # Should select evidence in order of priority
-    assert len(selected) > 0
-    
-    # First selected should be highest priority
-    if len(selected) > 1:
-        assert selected[0].evidence_id == "ev-1"  # Urgent content
+    selected = selector.select_context(sample_evidence)
+
+    # Everything fits the default budget
+    assert {c.evidence_id for c in selected} == {"ev-1", "ev-2", "ev-3"}
+
+    # First selected should be highest priority (urgent content)
+    assert selected[0].evidence_id == "ev-1"
+    assert selected[-1].evidence_id == "ev-3"
 
 
 def test_empty_input(selector):
     """Test handling of empty input."""
-    selected = selector.select_context([], [], 1000)
+    selected = selector.select_context([])
     assert selected == []
+    assert selector.get_metrics()['total_chunks_considered'] == 0
 
 
-def test_insufficient_tokens(selector, sample_threads, sample_evidence):
-    """Test handling when evidence exceeds token budget."""
-    max_tokens = 50  # Very small budget
-    
-    selected = selector.select_context(sample_threads, sample_evidence, max_tokens)
-    
-    # Should still return something, even if truncated
-    assert len(selected) > 0
-    total_tokens = sum(chunk.token_count for chunk in selected)
-    assert total_tokens <= max_tokens
-
-
-def test_sender_weighting(selector, sample_threads, sample_evidence):
-    """Test sender-based weighting."""
-    # High-priority sender
-    score = selector._calculate_sender_weight("ceo@company.com")
-    assert score > 0
-    
-    # Medium-priority sender
-    score = selector._calculate_sender_weight("manager@company.com")
-    assert score > 0
-    
-    # Low-priority sender
-    score = selector._calculate_sender_weight("user@company.com")
-    assert score == 0
-
-
-def test_thread_activity_scoring(selector, sample_threads, sample_evidence):
-    """Test thread activity scoring."""
-    # High activity thread
-    score = selector._calculate_thread_activity(5, Mock())
-    assert score > 0
-    
-    # Low activity thread
-    score = selector._calculate_thread_activity(1, Mock())
-    assert score == 0
+def test_recency_scoring(selector):
+    """Test recency decays with message age."""
+    def aged(hours):
+        return make_chunk("ev-r", metadata={'received_at': (NOW - timedelta(hours=hours)).isoformat()})
+
+    assert selector._calculate_recency_score(aged(0.5), NOW) == 1.0
+    assert selector._calculate_recency_score(aged(3), NOW) == 0.8
+    assert selector._calculate_recency_score(aged(12), NOW) == 0.5
+    assert selector._calculate_recency_score(aged(48), NOW) == 0.2
+
+    # Missing or unparseable timestamps fall back to the oldest tier
+    assert selector._calculate_recency_score(make_chunk("ev-r", metadata={'received_at': ''}), NOW) == 0.2
+    assert selector._calculate_recency_score(make_chunk("ev-r", metadata={'received_at': 'bogus'}), NOW) == 0.2
+
+
+def test_sender_weighting(selector):
+    """Test sender-rank weighting."""
+    low = score_of(selector, make_chunk("ev-1", signals={'sender_rank': 0}))
+    medium = score_of(selector, make_chunk("ev-2", signals={'sender_rank': 1}))
+    high = score_of(selector, make_chunk("ev-3", signals={'sender_rank': 3}))
+
+    assert low < medium < high
+
+
+def test_thread_activity_scoring(selector):
+    """Test the incoming priority score contributes to the enhanced score."""
+    quiet = score_of(selector, make_chunk("ev-1", priority_score=1.0))
+    active = score_of(selector, make_chunk("ev-2", priority_score=5.0))
+
+    assert active > quiet
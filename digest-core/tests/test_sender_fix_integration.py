@@ -7,6 +7,10 @@ from digest_core.ingest.ews import NormalizedMessage
 from digest_core.evidence.actions import ActionMentionExtractor
 
 
+# Fixed receive time shared by the test messages
+FIXED_TS = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
 def test_sender_fix_integration():
     """Test that the sender fix prevents AttributeError in actions stage."""
     # Create extractor
@@ -16,7 +20,7 @@ def test_sender_fix_integration():
     msg = NormalizedMessage(
         msg_id="test-sender-fix",
         conversation_id="conv-sender-fix",
-        datetime_received=datetime.now(timezone.utc),
+        datetime_received=FIXED_TS,
         sender_email="",  # Empty sender_email
         subject="Test Subject",
         text_body="Please review this document by Friday.",
@@ -33,7 +37,7 @@ def test_sender_fix_integration():
         cc_emails=[],
         message_id="test-sender-fix",
         body_norm="Please review this document by Friday.",
-        received_at=datetime.now(timezone.utc)
+        received_at=FIXED_TS
     )
     
     # Test that msg.sender returns empty string (not AttributeError)
@@ -59,7 +63,7 @@ def test_sender_fix_integration():
     msg_valid = NormalizedMessage(
         msg_id="test-sender-valid",
         conversation_id="conv-sender-valid",
-        datetime_received=datetime.now(timezone.utc),
+        datetime_received=FIXED_TS,
         sender_email="boss@company.com",
         subject="Urgent Task",
         text_body="Please complete the report by end of day.",
@@ -76,7 +80,7 @@ def test_sender_fix_integration():
         cc_emails=[],
         message_id="test-sender-valid",
         body_norm="Please complete the report by end of day.",
-        received_at=datetime.now(timezone.utc)
+        received_at=FIXED_TS
     )
     
     # Test that msg.sender returns valid email
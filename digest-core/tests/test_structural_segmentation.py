@@ -3,17 +3,28 @@ Tests for structural segmentation in EvidenceSplitter.
 """
 import pytest
 from datetime import datetime, timezone
+from digest_core.config import ChunkingConfig
 from digest_core.evidence.split import EvidenceSplitter
 from digest_core.ingest.ews import NormalizedMessage
 from digest_core.threads.build import ConversationThread
 
 
+# Fixed receive time shared by all test messages
+FIXED_TS = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+@pytest.fixture(scope="module")
+def splitter():
+    """Default EvidenceSplitter (stateless between calls), built once per module."""
+    return EvidenceSplitter()
+
+
 def create_test_message(text_body: str, msg_id: str = "msg1") -> NormalizedMessage:
     """Create a test normalized message."""
     return NormalizedMessage(
         msg_id=msg_id,
         conversation_id="thread1",
-        datetime_received=datetime.now(timezone.utc),
+        datetime_received=FIXED_TS,
         sender_email="sender@example.com",
         subject="Test Subject",
         text_body=text_body,
@@ -22,14 +33,21 @@ def create_test_message(text_body: str, msg_id: str = "msg1") -> NormalizedMessa
         importance="Normal",
         is_flagged=False,
         has_attachments=False,
-        attachment_types=[]
+        attachment_types=[],
+        from_email="sender@example.com",
+        from_name=None,
+        to_emails=["user@example.com"],
+        cc_emails=[],
+        message_id=msg_id,
+        body_norm=text_body,
+        received_at=FIXED_TS
     )
 
 
 class TestStructuralSegmentation:
     """Test suite for structural break detection."""
     
-    def test_markdown_headers_detected(self):
+    def test_markdown_headers_detected(self, splitter):
         """Test markdown headers create segment boundaries."""
         text = """
 Introduction paragraph here.
@@ -46,13 +64,12 @@ More content here.
 
 Final content.
 """
-        splitter = EvidenceSplitter()
         breaks = splitter._detect_structural_breaks(text)
         
         # Should detect the 3 markdown headers
         assert len(breaks) >= 3
     
-    def test_caps_headers_detected(self):
+    def test_caps_headers_detected(self, splitter):
         """Test CAPS + colon headers detected."""
         text = """
 Some introduction text.
@@ -69,13 +86,12 @@ More content.
 
 Russian header content.
 """
-        splitter = EvidenceSplitter()
         breaks = splitter._detect_structural_breaks(text)
         
         # Should detect at least the CAPS headers
         assert len(breaks) >= 3
     
-    def test_email_markers_detected(self):
+    def test_email_markers_detected(self, splitter):
         """Test 'On ... wrote:' creates boundaries."""
         text = """
 My reply to the email.
@@ -89,13 +105,12 @@ More quoted content.
 От: Иванов Иван
 Russian quoted content.
 """
-        splitter = EvidenceSplitter()
         breaks = splitter._detect_structural_breaks(text)
         
         # Should detect email markers
         assert len(breaks) >= 3
     
-    def test_numbered_lists_detected(self):
+    def test_numbered_lists_detected(self, splitter):
         """Test numbered lists create boundaries."""
         text = """
 Here are the action items:
@@ -109,13 +124,12 @@ And also:
 1) Option A
 2) Option B
 """
-        splitter = EvidenceSplitter()
         breaks = splitter._detect_structural_breaks(text)
         
         # Should detect list markers (at least the numbered ones)
         assert len(breaks) >= 3
     
-    def test_horizontal_rules_detected(self):
+    def test_horizontal_rules_detected(self, splitter):
         """Test horizontal rules create boundaries."""
         text = """
 Section one content.
@@ -132,23 +146,22 @@ Section three content.
 
 Final section.
 """
-        splitter = EvidenceSplitter()
         breaks = splitter._detect_structural_breaks(text)
         
         # Should detect horizontal rules
         assert len(breaks) >= 3
     
-    def test_long_email_segmentation(self):
+    def test_long_email_segmentation(self, splitter):
         """Test long email (>1000 tokens) splits intelligently."""
         # Create a long email with structure (>1000 tokens)
         long_text = """
 # Executive Summary
 
-""" + " ".join(["Important content"] * 200) + """
+""" + ("Important content " * 200).rstrip() + """
 
 # Technical Details
 
-""" + " ".join(["Technical information"] * 200) + """
+""" + ("Technical information " * 200).rstrip() + """
 
 # Action Items
 
@@ -160,7 +173,7 @@ Final section.
 
 # Appendix
 
-""" + " ".join(["Additional details"] * 200)
+""" + ("Additional details " * 200).rstrip()
         
         message = create_test_message(long_text)
         thread = ConversationThread(
@@ -171,7 +184,6 @@ Final section.
             message_count=1
         )
         
-        splitter = EvidenceSplitter()
         
         # Estimate tokens (should be >1000)
         estimated_tokens = len(long_text.split()) * 1.3
@@ -183,9 +195,9 @@ Final section.
         # Should create fewer chunks for long emails under high load
         assert len(chunks) <= 3  # max_chunks_if_long with adaptive multiplier
     
-    def test_adaptive_chunking_high_load(self):
+    def test_adaptive_chunking_high_load(self, splitter):
         """Test adaptive chunking reduces chunks under high load."""
-        text = " ".join(["Content"] * 500)  # Medium length email
+        text = ("Content " * 500).rstrip()  # Medium length email
         message = create_test_message(text)
         thread = ConversationThread(
             conversation_id="thread1",
@@ -195,7 +207,6 @@ Final section.
             message_count=1
         )
         
-        splitter = EvidenceSplitter()
         
         # Low load - should allow more chunks
         chunks_low = splitter.split_evidence([thread], total_emails=100, total_threads=30)
@@ -206,14 +217,14 @@ Final section.
         # High load should produce fewer or equal chunks
         assert len(chunks_high) <= len(chunks_low)
     
-    def test_adaptive_chunking_long_email(self):
+    def test_adaptive_chunking_long_email(self, splitter):
         """Test long emails get fewer chunks."""
         # Short email
-        short_text = " ".join(["Content"] * 200)
+        short_text = ("Content " * 200).rstrip()
         message_short = create_test_message(short_text, "msg1")
         
         # Long email (>1000 tokens)
-        long_text = " ".join(["Content"] * 1000)
+        long_text = ("Content " * 1000).rstrip()
         message_long = create_test_message(long_text, "msg2")
         
         thread_short = ConversationThread(
@@ -232,7 +243,6 @@ Final section.
             message_count=1
         )
         
-        splitter = EvidenceSplitter()
         
         chunks_short = splitter.split_evidence([thread_short], total_emails=100, total_threads=30)
         chunks_long = splitter.split_evidence([thread_long], total_emails=100, total_threads=30)
@@ -242,3 +252,25 @@ Final section.
         # Short email can have more
         assert len(chunks_short) >= len(chunks_long) or len(chunks_short) == 0
 
+
+def test_parallel_split_matches_serial(splitter):
+    """Splitting threads in worker processes yields the same chunks as in-process."""
+    body = "\n\n".join((f"Paragraph {i} content " * 30).rstrip() for i in range(6))
+    threads = []
+    for t in range(4):
+        message = create_test_message(body, f"msg{t}")
+        threads.append(ConversationThread(
+            conversation_id=f"thread{t}",
+            messages=[message],
+            latest_message_time=message.datetime_received,
+            participant_count=1,
+            message_count=1
+        ))
+    
+    parallel_splitter = EvidenceSplitter(chunking_config=ChunkingConfig(split_workers=2))
+    serial = splitter.split_evidence(threads)
+    parallel = parallel_splitter.split_evidence(threads)
+    
+    assert serial
+    assert [(c.conversation_id, c.content, c.token_count) for c in parallel] == \
+        [(c.conversation_id, c.content, c.token_count) for c in serial]
@@ -9,7 +9,11 @@ Covers:
 """
 import pytest
 from datetime import datetime, timezone
-from digest_core.threads.subject_normalizer import SubjectNormalizer, calculate_text_similarity
+from types import SimpleNamespace
+from unittest.mock import patch
+from digest_core.threads.subject_normalizer import (
+    SubjectNormalizer, calculate_text_similarity, get_text_ngrams, ngram_similarity
+)
 from digest_core.threads.build import ThreadBuilder, ConversationThread
 from digest_core.ingest.ews import NormalizedMessage
 
@@ -21,13 +25,31 @@ def normalizer():
     return SubjectNormalizer()
 
 
+def make_message(sender, **fields):
+    """NormalizedMessage with test defaults; sender fills the canonical from_email."""
+    defaults = {
+        "importance": "Normal",
+        "is_flagged": False,
+        "has_attachments": False,
+        "attachment_types": [],
+        "from_email": sender,
+        "from_name": None,
+        "to_emails": fields.get("to_recipients", []),
+        "cc_emails": fields.get("cc_recipients", []),
+        "message_id": fields["msg_id"],
+        "body_norm": fields["text_body"],
+        "received_at": fields["datetime_received"],
+    }
+    return NormalizedMessage(**{**defaults, **fields})
+
+
 @pytest.fixture
 def sample_messages():
     """Sample messages for testing."""
     base_time = datetime(2024, 1, 15, 10, 0, 0, tzinfo=timezone.utc)
     
     return [
-        NormalizedMessage(
+        make_message(
             msg_id="msg-001",
             conversation_id="conv-1",
             subject="Project Update",
@@ -38,7 +60,7 @@ def sample_messages():
             datetime_received=base_time,
             text_body="Hello, here is the project update for Q1.",
         ),
-        NormalizedMessage(
+        make_message(
             msg_id="msg-002",
             conversation_id="conv-1",
             subject="RE: Project Update",
@@ -129,7 +151,7 @@ class TestSubjectNormalizer:
     
     def test_normalize_complex_case(self, normalizer):
         """Test complex case with multiple transformations."""
-        subject = "RE: Fwd: [EXTERNAL] [JIRA-789] 🚨 Important — "Status Update""
+        subject = "RE: Fwd: [EXTERNAL] [JIRA-789] 🚨 Important — “Status Update”"
         norm, orig = normalizer.normalize(subject)
         assert norm == 'important - "status update"'
         assert orig == subject
@@ -176,6 +198,15 @@ class TestTextSimilarity:
         """Test empty texts."""
         similarity = calculate_text_similarity("", "test")
         assert similarity == 0.0
+    
+    def test_precomputed_ngrams_match_pairwise(self):
+        """Test n-grams built once give the same score as pairwise calculation."""
+        text1 = "This is a test message for the project update."
+        text2 = "This is a test message for the project status."
+        ngrams1 = get_text_ngrams(text1)
+        
+        assert ngram_similarity(ngrams1, get_text_ngrams(text2)) == calculate_text_similarity(text1, text2)
+        assert ngram_similarity(ngrams1, get_text_ngrams("")) == 0.0
 
 
 class TestThreadBuilder:
@@ -195,7 +226,7 @@ class TestThreadBuilder:
         base_time = datetime(2024, 1, 15, 10, 0, 0, tzinfo=timezone.utc)
         
         messages = [
-            NormalizedMessage(
+            make_message(
                 msg_id="msg-001",
                 conversation_id="conv-1",
                 subject="Project A",
@@ -206,7 +237,7 @@ class TestThreadBuilder:
                 datetime_received=base_time,
                 text_body="Project A update",
             ),
-            NormalizedMessage(
+            make_message(
                 msg_id="msg-002",
                 conversation_id="conv-2",
                 subject="Project B",
@@ -229,7 +260,7 @@ class TestThreadBuilder:
         base_time = datetime(2024, 1, 15, 10, 0, 0, tzinfo=timezone.utc)
         
         messages = [
-            NormalizedMessage(
+            make_message(
                 msg_id="msg-001",
                 conversation_id=None,  # No conv_id, will use subject
                 subject="Status Update",
@@ -240,7 +271,7 @@ class TestThreadBuilder:
                 datetime_received=base_time,
                 text_body="First update",
             ),
-            NormalizedMessage(
+            make_message(
                 msg_id="msg-002",
                 conversation_id=None,
                 subject="RE: Status Update",  # Should normalize to same
@@ -270,7 +301,7 @@ class TestThreadBuilder:
         
         # Very similar messages, same subject
         messages = [
-            NormalizedMessage(
+            make_message(
                 msg_id="msg-001",
                 conversation_id=None,
                 subject="Project Update",
@@ -281,7 +312,7 @@ class TestThreadBuilder:
                 datetime_received=base_time,
                 text_body="The Q1 project deliverables are on track and progressing well.",
             ),
-            NormalizedMessage(
+            make_message(
                 msg_id="msg-002",
                 conversation_id=None,
                 subject="Project Update",  # Same subject
@@ -300,6 +331,21 @@ class TestThreadBuilder:
         # Should merge into one thread by semantic similarity
         assert len(threads) == 1
         assert threads[0].message_count == 2
+    
+    def test_semantic_merge_skips_length_mismatch(self):
+        """Test bodies of very different length never reach the similarity scorer."""
+        messages = [
+            SimpleNamespace(subject="Project Update", text_body="Short note."),
+            SimpleNamespace(subject="Project Update", text_body="A much longer body " * 10),
+        ]
+        thread_groups = {"subj_a": messages[:1], "subj_b": messages[1:]}
+        
+        builder = ThreadBuilder(semantic_similarity_threshold=0.7)
+        with patch("digest_core.threads.build.ngram_similarity") as scorer:
+            merged = builder._merge_by_semantic_similarity(thread_groups)
+        
+        scorer.assert_not_called()
+        assert merged == thread_groups
 
 
 class TestDeduplication:
@@ -311,7 +357,7 @@ class TestDeduplication:
         
         # Two messages with identical body
         messages = [
-            NormalizedMessage(
+            make_message(
                 msg_id="msg-001",
                 conversation_id="conv-1",
                 subject="Update",
@@ -322,7 +368,7 @@ class TestDeduplication:
                 datetime_received=base_time,
                 text_body="Exact same content here.",
             ),
-            NormalizedMessage(
+            make_message(
                 msg_id="msg-002",  # Different ID
                 conversation_id="conv-1",
                 subject="Update",
@@ -345,6 +391,40 @@ class TestDeduplication:
         # Check stats
         stats = builder.get_stats()
         assert stats['duplicates_found'] == 1
+    
+    def test_min_dedup_body_length_boundary(self):
+        """Test bodies at MIN_DEDUP_BODY_CHARS are deduplicated, shorter ones are not."""
+        at_min = "x" * ThreadBuilder.MIN_DEDUP_BODY_CHARS
+        below_min = at_min[:-1]
+        messages = [
+            SimpleNamespace(msg_id="msg-001", text_body=at_min),
+            SimpleNamespace(msg_id="msg-002", text_body=at_min),
+            SimpleNamespace(msg_id="msg-003", text_body=below_min),
+            SimpleNamespace(msg_id="msg-004", text_body=below_min),
+        ]
+        
+        builder = ThreadBuilder()
+        unique_messages, duplicate_map = builder._deduplicate_by_checksum(messages)
+        
+        assert [m.msg_id for m in unique_messages] == ["msg-001", "msg-003", "msg-004"]
+        assert duplicate_map == {"msg-001": ["msg-002"]}
+        assert builder.stats['duplicates_found'] == 1
+    
+    def test_short_bodies_not_deduped(self):
+        """Test short identical replies are kept as distinct messages."""
+        messages = [
+            SimpleNamespace(msg_id="msg-001", text_body="ok"),
+            SimpleNamespace(msg_id="msg-002", text_body="ok"),
+            SimpleNamespace(msg_id="msg-003", text_body=""),
+            SimpleNamespace(msg_id="msg-004", text_body=None),
+        ]
+        
+        builder = ThreadBuilder()
+        unique_messages, duplicate_map = builder._deduplicate_by_checksum(messages)
+        
+        assert [m.msg_id for m in unique_messages] == ["msg-001", "msg-002", "msg-003", "msg-004"]
+        assert duplicate_map == {}
+        assert builder.stats['duplicates_found'] == 0
 
 
 class TestRedundancyIndex:
@@ -378,7 +458,7 @@ class TestRedundancyIndex:
         # Original messages
         for i in range(10):
             messages.append(
-                NormalizedMessage(
+                make_message(
                     msg_id=f"msg-{i}",
                     conversation_id=None,
                     subject=f"Subject {i % 3}",  # Only 3 unique subjects
@@ -393,7 +473,7 @@ class TestRedundancyIndex:
         
         # Add some exact duplicates
         messages.extend([
-            NormalizedMessage(
+            make_message(
                 msg_id=f"msg-dup-{i}",
                 conversation_id=None,
                 subject=f"Subject {i % 3}",
@@ -426,7 +506,7 @@ class TestThreadingStatistics:
         base_time = datetime(2024, 1, 15, 10, 0, 0, tzinfo=timezone.utc)
         
         messages = [
-            NormalizedMessage(
+            make_message(
                 msg_id="msg-001",
                 conversation_id="conv-1",
                 subject="Original",
@@ -437,7 +517,7 @@ class TestThreadingStatistics:
                 datetime_received=base_time,
                 text_body="Original content",
             ),
-            NormalizedMessage(
+            make_message(
                 msg_id="msg-002",
                 conversation_id="conv-1",
                 subject="RE: Original",
@@ -480,7 +560,7 @@ class TestEdgeCases:
         base_time = datetime(2024, 1, 15, 10, 0, 0, tzinfo=timezone.utc)
         
         messages = [
-            NormalizedMessage(
+            make_message(
                 msg_id="msg-001",
                 conversation_id=None,
                 subject="Single",
@@ -504,7 +584,7 @@ class TestEdgeCases:
         base_time = datetime(2024, 1, 15, 10, 0, 0, tzinfo=timezone.utc)
         
         messages = [
-            NormalizedMessage(
+            make_message(
                 msg_id="msg-001",
                 conversation_id=None,
                 subject="",  # Empty subject
@@ -515,7 +595,7 @@ class TestEdgeCases:
                 datetime_received=base_time,
                 text_body="Content 1",
             ),
-            NormalizedMessage(
+            make_message(
                 msg_id="msg-002",
                 conversation_id=None,
                 subject="",  # Empty subject
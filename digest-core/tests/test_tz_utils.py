@@ -5,7 +5,7 @@ import pytest
 from datetime import datetime, timezone
 from zoneinfo import ZoneInfo
 from unittest.mock import Mock
-from digest_core.utils.tz import ensure_aware, to_utc, ensure_aware_and_utc, get_suppressed_stats
+from digest_core.utils.tz import ensure_aware, to_utc, ensure_aware_and_utc, get_suppressed_stats, get_zone
 
 
 def test_ensure_aware_with_naive_datetime():
@@ -51,6 +51,15 @@ def test_ensure_aware_with_metrics():
     mock_metrics.record_tz_naive.assert_called_once()
 
 
+def test_get_zone_is_cached():
+    """Test get_zone returns one shared ZoneInfo per timezone name."""
+    zone = get_zone("Europe/Moscow")
+    
+    assert zone == ZoneInfo("Europe/Moscow")
+    assert get_zone("Europe/Moscow") is zone
+    assert ensure_aware(datetime(2024, 1, 15, 10, 30), "Europe/Moscow").tzinfo is zone
+
+
 def test_ensure_aware_with_none_raises():
     """Test ensure_aware with None raises ValueError."""
     with pytest.raises(ValueError, match="Cannot ensure timezone awareness for None"):